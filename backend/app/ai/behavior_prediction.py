@@ -122,7 +122,7 @@ class BehaviorPredictionModel:
             ... )
         """
         if not interaction_history:
-            logger.warning(f"No interaction history provided for pet {pet_id}")
+            logger.warning("No interaction history provided for pet %s", pet_id)
             return self._generate_empty_predictions(forecast_days)
 
         # Analyze interaction patterns
@@ -140,12 +140,12 @@ class BehaviorPredictionModel:
                 ai_predictions = await self._get_ai_predictions(
                     pet_id, pattern_analysis, current_stats, forecast_days, settings
                 )
-                logger.info(f"AI predictions generated for pet {pet_id}")
+                logger.info("AI predictions generated for pet %s", pet_id)
                 
                 # Combine AI predictions with statistical analysis
                 return self._combine_predictions(ai_predictions, pattern_analysis, forecast_days)
             except Exception as e:
-                logger.warning(f"AI prediction failed, using statistical analysis: {e}")
+                logger.warning("AI prediction failed, using statistical analysis: %s", e)
 
         # Use statistical/rule-based predictions
         return self._generate_statistical_predictions(pattern_analysis, current_stats, forecast_days)
@@ -220,7 +220,7 @@ class BehaviorPredictionModel:
                 day_name = timestamp.strftime("%A")
                 day_patterns[day_name] += 1
             except (ValueError, AttributeError):
-                logger.debug(f"Could not parse timestamp: {timestamp_str}")
+                logger.debug("Could not parse timestamp: %s", timestamp_str)
 
             # Track stat changes
             stats_before = interaction.get("pet_stats_before", {})
@@ -388,7 +388,7 @@ Return a JSON object:
                     "recommendations": parsed.get("recommendations", []),
                 }
             except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse AI response: {e}")
+                logger.error("Failed to parse AI response: %s", e)
                 return {}
         finally:
             if close_client:
@@ -45,6 +45,9 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Leading numbering or bullet on an AI recommendation line
+_LIST_MARKER_PATTERN = re.compile(r"^[\d\.\-\*]+\s*")
+
 
 class BudgetForecastingEngine:
     """
@@ -165,7 +168,7 @@ class BudgetForecastingEngine:
                     pattern_analysis, trends, monthly_budget, user_id, settings
                 )
             except Exception as e:
-                logger.warning(f"AI recommendations failed, using fallback: {e}")
+                logger.warning("AI recommendations failed, using fallback: %s", e)
                 recommendations = self._generate_fallback_recommendations(
                     pattern_analysis, trends, monthly_budget
                 )
@@ -242,7 +245,7 @@ class BudgetForecastingEngine:
                 month_key = dt.strftime("%Y-%m")
                 monthly_spending[month_key].append(expense_amount)
             except (ValueError, AttributeError, TypeError):
-                logger.debug(f"Could not parse date: {date_str}")
+                logger.debug("Could not parse date: %s", date_str)
                 continue
 
         # Calculate monthly totals and statistics
@@ -670,7 +673,7 @@ Keep recommendations concise, practical, and encouraging."""
             for line in content.split("\n"):
                 line = line.strip()
                 # Remove numbering, bullets
-                line = re.sub(r"^[\d\.\-\*]+\s*", "", line)
+                line = _LIST_MARKER_PATTERN.sub("", line)
                 if line and len(line) > 10:
                     recommendations.append(line)
                 if len(recommendations) >= 5:
@@ -679,7 +682,7 @@ Keep recommendations concise, practical, and encouraging."""
             return recommendations[:5]
 
         except Exception as e:
-            logger.error(f"AI recommendation generation failed: {e}")
+            logger.error("AI recommendation generation failed: %s", e)
             return self._generate_fallback_recommendations(pattern_analysis, trends, monthly_budget)
         finally:
             if close_client:
@@ -30,9 +30,12 @@ Example Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
-from typing import Any, Dict, List, Optional
+import string
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import httpx
 
@@ -40,6 +43,39 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Leading numbering, bullets and quotes on lines returned by the AI model
+_LIST_MARKER_PATTERN = re.compile(r"^[\d\.\-\*\"\']+\s*")
+
+# Prompt pieces for AI suggestions, built once at import
+_SUGGESTION_PROMPT_TEMPLATE = """Generate 5 creative and unique pet name suggestions.
+
+Input name: "{input_name}"
+Input is valid: {is_valid}
+{species_context}
+
+Requirements:
+- Names should be 1-20 characters
+- Appropriate and family-friendly
+- Creative and memorable
+- Suitable for a virtual pet companion
+- If input is valid, suggest similar or alternative creative names
+- If input is invalid, suggest completely new, appropriate names
+
+Return only the names, one per line, without numbering, bullets, or extra text."""
+
+_SUGGESTION_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are a creative pet naming assistant. Generate fun, appropriate, "
+        "and memorable pet names that fit the context."
+    ),
+}
+
+# ASCII characters accepted by VALID_CHAR_PATTERN (alphanumerics, whitespace, hyphen, apostrophe)
+_ASCII_NAME_CHARS = frozenset(
+    string.ascii_letters + string.digits + "-'" + "".join(c for c in map(chr, range(128)) if c.isspace())
+)
+
 
 class NameValidatorAI:
     """
@@ -59,15 +95,27 @@ class NameValidatorAI:
     MIN_LENGTH = 1
     MAX_LENGTH = 20
 
-    # Basic profanity filter (in production, use comprehensive library)
-    PROFANITY_WORDS = {
-        "badword1",
-        "badword2",
-        # Add more as needed - production should use a library like better-profanity
-    }
-
-    # Character pattern: alphanumeric, spaces, hyphens, apostrophes
-    VALID_CHAR_PATTERN = re.compile(r"^[a-zA-Z0-9]([a-zA-Z0-9\s\-\']*[a-zA-Z0-9])?$")
+    # Basic profanity filter (in production, use comprehensive library).
+    # Stored lowercased and frozen so the per-request check never re-normalizes it.
+    PROFANITY_WORDS = frozenset(
+        word.lower()
+        for word in (
+            "badword1",
+            "badword2",
+            # Add more as needed - production should use a library like better-profanity
+        )
+    )
+    # All words compiled into one alternation so a name is scanned once, not once per word
+    PROFANITY_PATTERN = re.compile("|".join(map(re.escape, sorted(PROFANITY_WORDS, key=len, reverse=True))))
+
+    # Character pattern: alphanumeric, spaces, hyphens, apostrophes.
+    # Used with fullmatch(), so no anchors and no capturing group are needed.
+    VALID_CHAR_PATTERN = re.compile(r"[a-zA-Z0-9](?:[a-zA-Z0-9\s\-\']*[a-zA-Z0-9])?", re.UNICODE)
+    # Length, format and "has a letter" in a single pattern for the common valid case
+    VALID_NAME_PATTERN = re.compile(
+        rf"(?=.{{{MIN_LENGTH},{MAX_LENGTH}}}\Z)(?=.*?[a-zA-Z])" + VALID_CHAR_PATTERN.pattern,
+        re.UNICODE | re.DOTALL,
+    )
 
     # Species-specific name suggestions (fallback)
     SPECIES_SUGGESTIONS = {
@@ -77,6 +125,18 @@ class NameValidatorAI:
         "default": ["Buddy", "Max", "Luna", "Bella", "Charlie", "Rocky", "Daisy"],
     }
 
+    # Prompt hints per species for AI suggestions
+    SPECIES_PROMPT_HINTS = {
+        "feline": "Suggest names that fit cats - elegant, playful, or mysterious.",
+        "canine": "Suggest names that fit dogs - friendly, energetic, or loyal.",
+        "dragon": "Suggest names that fit dragons - powerful, majestic, or mystical.",
+    }
+
+    # Fallback variation parts and generic names, built once instead of per call
+    NAME_SUFFIXES = ("y", "ie", "o", "er")
+    NAME_PREFIXES = ("Little ", "Big ", "Super ")
+    GENERIC_SUGGESTIONS = ("Buddy", "Max", "Luna", "Bella", "Charlie", "Rocky", "Daisy", "Milo", "Oliver")
+
     def __init__(self, client: Optional[httpx.AsyncClient] = None) -> None:
         """
         Initialize the Name Validator AI.
@@ -86,6 +146,9 @@ class NameValidatorAI:
                    a new client will be created per request.
         """
         self._client = client
+        # In-flight AI suggestion requests keyed by (name, validity, species) so
+        # concurrent callers asking for the same suggestions share one API call.
+        self._inflight_suggestions: Dict[Tuple[str, bool, str], asyncio.Task] = {}
         logger.info("NameValidatorAI initialized")
 
     async def validate_and_suggest(
@@ -126,10 +189,14 @@ class NameValidatorAI:
             >>> print(result["valid"])  # True
             >>> print(result["suggestions"])  # ["Fluffy", "Whiskers", ...]
         """
+        # Normalize once; the stripped and lowercased forms are reused below
         input_name = input_name.strip() if input_name else ""
-        
+        name_lower = input_name.lower()
+
         # Perform validation
-        validation_result = self._validate_name(input_name, existing_names if check_uniqueness else None)
+        validation_result = self._validate_name(
+            input_name, existing_names if check_uniqueness else None, name_lower=name_lower
+        )
         is_valid = validation_result["valid"]
         errors = validation_result["errors"]
 
@@ -137,11 +204,9 @@ class NameValidatorAI:
         suggestions: List[str] = []
         try:
             if is_valid or True:  # Always generate suggestions
-                suggestions = await self._generate_ai_suggestions(
-                    input_name, is_valid, pet_species
-                )
+                suggestions = await self._coalesced_ai_suggestions(input_name, is_valid, pet_species)
         except Exception as e:
-            logger.warning(f"AI suggestion generation failed, using fallback: {e}")
+            logger.warning("AI suggestion generation failed, using fallback: %s", e)
             suggestions = self._generate_fallback_suggestions(input_name, pet_species)
 
         # Limit suggestions to 5
@@ -154,54 +219,107 @@ class NameValidatorAI:
             "validation_details": validation_result.get("details", {}),
         }
 
-    def _validate_name(self, name: str, existing_names: Optional[List[str]] = None) -> Dict[str, Any]:
+    def _validate_name(
+        self,
+        name: str,
+        existing_names: Optional[List[str]] = None,
+        name_lower: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Validate name against all rules.
         
         Validation algorithm:
         1. Checks if name is empty
-        2. Validates length constraints
-        3. Validates character format
+        2. Validates length constraints (stops here on failure)
+        3. Validates character format and letters (stops here on format failure)
         4. Checks for profanity
         5. Optionally checks uniqueness
         
         Args:
             name: Name to validate
             existing_names: Optional list to check uniqueness against
+            name_lower: Lowercased name if the caller already computed it
         
         Returns:
             Dictionary with validation results
         """
-        errors = []
+        rule_errors, rule_details, blocked = self._check_name_rules(name)
+        # Copy the cached results so callers can never mutate the cache
+        errors = list(rule_errors)
+        details: Dict[str, Any] = dict(rule_details)
+        if blocked:
+            return {"valid": False, "errors": errors, "details": details}
+
+        # Uniqueness check (if requested)
+        if existing_names:
+            if name_lower is None:
+                name_lower = name.lower()
+            # Stop at the first match instead of lowering every existing name up front
+            if any(existing.lower() == name_lower for existing in existing_names):
+                errors.append("Name is already taken. Please choose a different name.")
+                details["unique"] = False
+            else:
+                details["unique"] = True
+
+        is_valid = len(errors) == 0
+        return {"valid": is_valid, "errors": errors, "details": details}
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _check_name_rules(
+        cls, name: str
+    ) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, Any], ...], bool]:
+        """
+        Run the name-only rules (empty, length, format, letters, profanity).
+
+        These depend only on the name, so results are cached; popular names
+        and retries of the same name skip the checks entirely.
+
+        Args:
+            name: Name to validate
+
+        Returns:
+            Tuple of (errors, details items, blocked) where blocked means the
+            name failed a rule that ends validation early
+        """
+        errors: List[str] = []
         details: Dict[str, Any] = {}
 
         # Empty check
         if not name:
             errors.append("Name cannot be empty")
             details["empty"] = True
-            return {"valid": False, "errors": errors, "details": details}
+            return tuple(errors), tuple(details.items()), True
 
         details["empty"] = False
 
-        # Length validation
         length = len(name)
         details["length"] = length
-        if length < self.MIN_LENGTH:
-            errors.append(f"Name must be at least {self.MIN_LENGTH} character long")
-        elif length > self.MAX_LENGTH:
-            errors.append(f"Name must be no more than {self.MAX_LENGTH} characters long")
-        else:
+
+        # Fast path: one regex scan covers length, format and the letter rule
+        if cls.VALID_NAME_PATTERN.fullmatch(name):
             details["length_valid"] = True
+            details["format_valid"] = True
+            details["has_letters"] = True
+            return cls._check_profanity(name, errors, details)
+
+        # Length validation
+        if length < cls.MIN_LENGTH:
+            errors.append(f"Name must be at least {cls.MIN_LENGTH} character long")
+            return tuple(errors), tuple(details.items()), True
+        if length > cls.MAX_LENGTH:
+            errors.append(f"Name must be no more than {cls.MAX_LENGTH} characters long")
+            return tuple(errors), tuple(details.items()), True
+        details["length_valid"] = True
 
         # Format validation
-        if not self.VALID_CHAR_PATTERN.match(name):
+        format_valid = cls._has_valid_format(name)
+        details["format_valid"] = format_valid
+        if not format_valid:
             errors.append(
                 "Name can only contain letters, numbers, spaces, hyphens, and apostrophes. "
                 "Must start and end with alphanumeric characters."
             )
-            details["format_valid"] = False
-        else:
-            details["format_valid"] = True
 
         # Check for at least one letter
         if not any(c.isalpha() for c in name):
@@ -210,26 +328,80 @@ class NameValidatorAI:
         else:
             details["has_letters"] = True
 
-        # Profanity check
-        name_lower = name.lower()
-        for word in self.PROFANITY_WORDS:
-            if word in name_lower:
-                errors.append("Name contains inappropriate content")
-                details["profanity"] = True
-                return {"valid": False, "errors": errors, "details": details}
+        # A badly formatted name is already rejected; skip the profanity scan
+        if not format_valid:
+            return tuple(errors), tuple(details.items()), True
+
+        return cls._check_profanity(name, errors, details)
+
+    @classmethod
+    def _check_profanity(
+        cls, name: str, errors: List[str], details: Dict[str, Any]
+    ) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, Any], ...], bool]:
+        """Finish _check_name_rules with the profanity check."""
+        if cls.PROFANITY_WORDS and cls.PROFANITY_PATTERN.search(name.lower()):
+            errors.append("Name contains inappropriate content")
+            details["profanity"] = True
+            return tuple(errors), tuple(details.items()), True
 
         details["profanity"] = False
+        return tuple(errors), tuple(details.items()), False
 
-        # Uniqueness check (if requested)
-        if existing_names:
-            if name.lower() in [n.lower() for n in existing_names]:
-                errors.append("Name is already taken. Please choose a different name.")
-                details["unique"] = False
-            else:
-                details["unique"] = True
+    @classmethod
+    def _has_valid_format(cls, name: str) -> bool:
+        """
+        Check a name against VALID_CHAR_PATTERN.
 
-        is_valid = len(errors) == 0
-        return {"valid": is_valid, "errors": errors, "details": details}
+        Plain ASCII names (the common case) are checked with a character-set
+        test and edge checks; anything else goes through the regex.
+
+        Args:
+            name: Name to check
+
+        Returns:
+            True if the name has a valid format
+        """
+        if name.isascii():
+            return (
+                bool(name)
+                and name[0].isalnum()
+                and name[-1].isalnum()
+                and _ASCII_NAME_CHARS.issuperset(name)
+            )
+        return cls.VALID_CHAR_PATTERN.fullmatch(name) is not None
+
+    async def _coalesced_ai_suggestions(
+        self,
+        input_name: str,
+        is_valid: bool,
+        pet_species: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Generate AI suggestions, sharing one request among concurrent identical callers.
+
+        The first caller for a key starts the request; callers arriving while it
+        is still in flight await the same task instead of issuing their own call.
+        The key is the exact arguments, since they are what the shared prompt is built from.
+
+        Args:
+            input_name: Original input name
+            is_valid: Whether the input name is valid
+            pet_species: Optional pet species for context
+
+        Returns:
+            List of creative name suggestions
+        """
+        key = (input_name, is_valid, pet_species)
+        task = self._inflight_suggestions.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._generate_ai_suggestions(input_name, is_valid, pet_species)
+            )
+            self._inflight_suggestions[key] = task
+            task.add_done_callback(lambda _: self._inflight_suggestions.pop(key, None))
+
+        # Shield so one cancelled caller does not cancel the request for the others
+        return list(await asyncio.shield(task))
 
     async def _generate_ai_suggestions(
         self,
@@ -260,40 +432,19 @@ class NameValidatorAI:
         # Build context-aware prompt
         species_context = ""
         if pet_species:
-            species_context = f"The pet is a {pet_species}. "
-            if pet_species.lower() == "feline":
-                species_context += "Suggest names that fit cats - elegant, playful, or mysterious."
-            elif pet_species.lower() == "canine":
-                species_context += "Suggest names that fit dogs - friendly, energetic, or loyal."
-            elif "dragon" in pet_species.lower():
-                species_context += "Suggest names that fit dragons - powerful, majestic, or mystical."
-
-        prompt = f"""Generate 5 creative and unique pet name suggestions.
-
-Input name: "{input_name}"
-Input is valid: {is_valid}
-{species_context}
-
-Requirements:
-- Names should be 1-20 characters
-- Appropriate and family-friendly
-- Creative and memorable
-- Suitable for a virtual pet companion
-- If input is valid, suggest similar or alternative creative names
-- If input is invalid, suggest completely new, appropriate names
-
-Return only the names, one per line, without numbering, bullets, or extra text."""
-
-        messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You are a creative pet naming assistant. Generate fun, appropriate, "
-                    "and memorable pet names that fit the context."
-                ),
-            },
-            {"role": "user", "content": prompt},
-        ]
+            species_lower = pet_species.lower()
+            hint = self.SPECIES_PROMPT_HINTS.get(species_lower)
+            if hint is None and "dragon" in species_lower:
+                # Dragon variants ("fire dragon", ...) share the dragon hint
+                hint = self.SPECIES_PROMPT_HINTS["dragon"]
+            species_context = f"The pet is a {pet_species}. {hint or ''}"
+
+        prompt = _SUGGESTION_PROMPT_TEMPLATE.format(
+            input_name=input_name,
+            is_valid=is_valid,
+            species_context=species_context,
+        )
+        messages = [_SUGGESTION_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
 
         # Determine API endpoint
         api_url = getattr(settings, "openrouter_base_url", None) or getattr(settings, "openai_chat_api", None)
@@ -324,33 +475,29 @@ Return only the names, one per line, without numbering, bullets, or extra text."
             result = response.json()
             content = result["choices"][0]["message"]["content"].strip()
 
-            # Parse suggestions from response (one per line)
-            suggestions = []
+            # Parse suggestions from response (one per line), deduplicating
+            # case-insensitively while keeping the first spelling seen
+            unique_suggestions: Dict[str, str] = {}
+            valid_name = self.VALID_NAME_PATTERN.fullmatch
             for line in content.split("\n"):
                 line = line.strip()
                 # Remove numbering, bullets, quotes
-                line = re.sub(r"^[\d\.\-\*\"\']+\s*", "", line)
+                line = _LIST_MARKER_PATTERN.sub("", line)
                 line = line.strip('"\'')
-                if line and 1 <= len(line) <= self.MAX_LENGTH:
-                    # Quick validation check
-                    if self.VALID_CHAR_PATTERN.match(line) and any(c.isalpha() for c in line):
-                        suggestions.append(line)
-
-            # Remove duplicates and limit
-            seen = set()
-            unique_suggestions = []
-            for suggestion in suggestions:
-                suggestion_lower = suggestion.lower()
-                if suggestion_lower not in seen:
-                    seen.add(suggestion_lower)
-                    unique_suggestions.append(suggestion)
-                if len(unique_suggestions) >= 5:
-                    break
-
-            return unique_suggestions[:5]
+                # Length, format and letter rules in one scan
+                if valid_name(line):
+                    unique_suggestions.setdefault(line.lower(), line)
+                    if len(unique_suggestions) >= 5:
+                        break
 
-        except Exception as e:
-            logger.error(f"AI suggestion generation failed: {e}")
+            return list(unique_suggestions.values())
+
+        except httpx.TimeoutException:
+            # Expected under provider load; no traceback needed
+            logger.warning("AI suggestion request timed out, using fallback")
+            return self._generate_fallback_suggestions(input_name, pet_species)
+        except (httpx.HTTPError, KeyError, IndexError, TypeError, ValueError) as e:
+            logger.error("AI suggestion generation failed: %s", e)
             return self._generate_fallback_suggestions(input_name, pet_species)
         finally:
             if close_client:
@@ -376,22 +523,43 @@ Return only the names, one per line, without numbering, bullets, or extra text."
         Returns:
             List of fallback suggestions
         """
-        suggestions = []
         base_name = input_name.strip().lower() if input_name else ""
 
-        # Generate variations of input name
+        # Single pass over lazily generated candidates: dedupe as we go and stop
+        # as soon as five suggestions are collected.
+        suggestions: List[str] = []
+        seen = set()
+        for candidate in self._iter_fallback_candidates(base_name, pet_species):
+            if candidate in seen:
+                continue
+            seen.add(candidate)
+            suggestions.append(candidate)
+            if len(suggestions) >= 5:
+                break
+
+        return suggestions
+
+    def _iter_fallback_candidates(self, base_name: str, pet_species: Optional[str] = None) -> Iterator[str]:
+        """
+        Yield fallback name candidates in priority order.
+
+        Args:
+            base_name: Lowercased input name (may be empty)
+            pet_species: Optional pet species
+
+        Yields:
+            Candidate names; duplicates are filtered by the caller
+        """
+        # Generate variations of input name. Bases under 15 characters plus the
+        # longest affix ("Super ") always fit MAX_LENGTH, so no length filter is needed.
         if base_name and len(base_name) < 15:
             # Add common suffixes
-            for suffix in ["y", "ie", "o", "er", "y"]:
-                variation = base_name + suffix
-                if 1 <= len(variation) <= self.MAX_LENGTH:
-                    suggestions.append(variation.capitalize())
+            for suffix in self.NAME_SUFFIXES:
+                yield (base_name + suffix).capitalize()
 
             # Add common prefixes
-            for prefix in ["Little ", "Big ", "Super "]:
-                variation = prefix + base_name
-                if 1 <= len(variation) <= self.MAX_LENGTH:
-                    suggestions.append(variation.capitalize())
+            for prefix in self.NAME_PREFIXES:
+                yield (prefix + base_name).capitalize()
 
         # Add species-specific suggestions
         species_key = pet_species.lower() if pet_species else "default"
@@ -399,18 +567,10 @@ Return only the names, one per line, without numbering, bullets, or extra text."
             species_key = "default"
 
         for name in self.SPECIES_SUGGESTIONS[species_key]:
-            name_lower = name.lower()
-            if name_lower != base_name and name not in suggestions:
-                suggestions.append(name)
-            if len(suggestions) >= 5:
-                break
+            if name.lower() != base_name:
+                yield name
 
         # Add generic popular names if we don't have enough
-        generic_names = ["Buddy", "Max", "Luna", "Bella", "Charlie", "Rocky", "Daisy", "Milo", "Oliver"]
-        for name in generic_names:
-            if name.lower() != base_name and name not in suggestions:
-                suggestions.append(name)
-            if len(suggestions) >= 5:
-                break
-
-        return suggestions[:5]
+        for name in self.GENERIC_SUGGESTIONS:
+            if name.lower() != base_name:
+                yield name
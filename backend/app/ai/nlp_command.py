@@ -40,7 +40,8 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
@@ -76,6 +77,67 @@ class NLPCommandEngine:
         "budget": "Check financial status",
     }
 
+    # Fallback keyword table: (action, keywords in priority order, high-priority keywords).
+    # Built once at import instead of on every fallback parse.
+    ACTION_KEYWORDS = (
+        (
+            "feed",
+            ("feed", "give food", "hungry", "eat", "meal", "treat", "snack", "food"),
+            frozenset({"feed", "hungry", "eat"}),
+        ),
+        (
+            "play",
+            ("play", "game", "fetch", "toy", "fun", "exercise", "train"),
+            frozenset({"play", "game", "fetch"}),
+        ),
+        (
+            "bathe",
+            ("bathe", "bath", "clean", "wash", "groom", "shower"),
+            frozenset({"bathe", "bath", "clean"}),
+        ),
+        (
+            "rest",
+            ("rest", "sleep", "nap", "tired", "sleepy", "bed"),
+            frozenset({"rest", "sleep", "nap"}),
+        ),
+        (
+            "status",
+            ("status", "stats", "check", "how is", "health", "condition"),
+            frozenset({"status", "stats", "check"}),
+        ),
+        (
+            "shop",
+            ("shop", "store", "buy", "purchase", "market"),
+            frozenset({"shop", "store", "buy"}),
+        ),
+        (
+            "budget",
+            ("budget", "money", "coins", "balance", "finance", "spending"),
+            frozenset({"budget", "money", "balance"}),
+        ),
+    )
+    # Same table with each keyword's base confidence resolved up front
+    _KEYWORD_CONFIDENCES = tuple(
+        (action, tuple((keyword, 0.7 if keyword in high_priority else 0.5) for keyword in keywords))
+        for action, keywords, high_priority in ACTION_KEYWORDS
+    )
+
+    # Default suggestions for empty and unrecognized commands
+    EMPTY_COMMAND_SUGGESTIONS = (
+        "Try: 'feed my pet'",
+        "Try: 'play with my pet'",
+        "Try: 'check status'",
+    )
+    UNKNOWN_COMMAND_SUGGESTIONS = EMPTY_COMMAND_SUGGESTIONS + ("Try: 'bathe my pet'",)
+
+    # Parameter extraction per action: (parameter, ((value, keywords), ...), default).
+    # Options are checked in order and the first with a matching keyword wins.
+    PARAMETER_RULES = {
+        "feed": ("food_type", (("tuna", ("tuna",)), ("treat", ("treat", "snack"))), "standard"),
+        "play": ("game_type", (("fetch", ("fetch",)), ("puzzle", ("puzzle",))), "free_play"),
+        "rest": ("duration_hours", (("8", ("long", "overnight")), ("2", ("nap",))), "4"),
+    }
+
     def __init__(self, client: Optional[httpx.AsyncClient] = None) -> None:
         """
         Initialize the NLP Command Engine.
@@ -138,18 +200,14 @@ class NLPCommandEngine:
             >>> print(result["parameters"]["food_type"])  # "tuna"
         """
         if not command or not command.strip():
-            logger.warning(f"Empty command received from user {user_id}")
+            logger.warning("Empty command received from user %s", user_id)
             return {
                 "action": "unknown",
                 "confidence": 0.0,
                 "parameters": {},
                 "intent": "No command provided",
                 "needs_clarification": True,
-                "suggestions": [
-                    "Try: 'feed my pet'",
-                    "Try: 'play with my pet'",
-                    "Try: 'check status'",
-                ],
+                "suggestions": list(self.EMPTY_COMMAND_SUGGESTIONS),
                 "error": "Command cannot be empty",
                 "fallback_used": True,
             }
@@ -159,7 +217,7 @@ class NLPCommandEngine:
         # Initialize or retrieve conversation context
         if session_id not in self._conversation_context:
             self._conversation_context[session_id] = []
-            logger.debug(f"Created new conversation context for session {session_id}")
+            logger.debug("Created new conversation context for session %s", session_id)
 
         # Add user command to conversation history
         self._conversation_context[session_id].append({"role": "user", "content": command})
@@ -170,16 +228,18 @@ class NLPCommandEngine:
             try:
                 result = await self._process_with_ai(command, session_id, pet_context, settings)
                 logger.info(
-                    f"AI processing successful for command '{command[:50]}...' "
-                    f"- Action: {result.get('action')}, Confidence: {result.get('confidence')}"
+                    "AI processing successful for command '%.50s...' - Action: %s, Confidence: %s",
+                    command,
+                    result.get("action"),
+                    result.get("confidence"),
                 )
                 return result
             except Exception as e:
-                logger.warning(f"AI processing failed, using fallback: {e}")
+                logger.warning("AI processing failed, using fallback: %s", e)
 
         # Fallback to rule-based parsing
         result = await self._process_with_fallback(command, session_id, pet_context)
-        logger.info(f"Fallback processing used for command '{command[:50]}...'")
+        logger.info("Fallback processing used for command '%.50s...'", command)
         return result
 
     async def _process_with_ai(
@@ -246,27 +306,22 @@ Consider the pet's current state when interpreting commands (e.g., low hunger mi
         # Build pet context information string
         context_info = ""
         if pet_context:
-            context_info = "\nPet Context:\n"
+            context_lines = ["\nPet Context:"]
             if pet_context.get("name"):
-                context_info += f"- Name: {pet_context.get('name')}\n"
+                context_lines.append(f"- Name: {pet_context.get('name')}")
             if "hunger" in pet_context:
                 hunger = pet_context.get("hunger", 70)
-                context_info += f"- Hunger: {hunger}/100"
-                if hunger < 30:
-                    context_info += " (very low - may need feeding)"
-                elif hunger < 50:
-                    context_info += " (low)"
-                context_info += "\n"
+                hunger_note = " (very low - may need feeding)" if hunger < 30 else " (low)" if hunger < 50 else ""
+                context_lines.append(f"- Hunger: {hunger}/100{hunger_note}")
             if "happiness" in pet_context:
-                context_info += f"- Happiness: {pet_context.get('happiness', 70)}/100\n"
+                context_lines.append(f"- Happiness: {pet_context.get('happiness', 70)}/100")
             if "energy" in pet_context:
                 energy = pet_context.get("energy", 70)
-                context_info += f"- Energy: {energy}/100"
-                if energy < 30:
-                    context_info += " (very low - may need rest)"
-                context_info += "\n"
+                energy_note = " (very low - may need rest)" if energy < 30 else ""
+                context_lines.append(f"- Energy: {energy}/100{energy_note}")
             if "cleanliness" in pet_context:
-                context_info += f"- Cleanliness: {pet_context.get('cleanliness', 70)}/100\n"
+                context_lines.append(f"- Cleanliness: {pet_context.get('cleanliness', 70)}/100")
+            context_info = "\n".join(context_lines) + "\n"
 
         # Build conversation history (last 10 exchanges for context)
         messages = [{"role": "system", "content": system_prompt}]
@@ -344,12 +399,58 @@ Consider the pet's current state when interpreting commands (e.g., low hunger mi
                     "fallback_used": False,
                 }
             except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse AI response as JSON: {e}, Content: {content[:100]}")
+                logger.error("Failed to parse AI response as JSON: %s, Content: %.100s", e, content)
                 raise
         finally:
             if close_client:
                 await client.aclose()
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _match_keywords(cls, command_lower: str) -> Tuple[Optional[str], float, Optional[Tuple[str, str]]]:
+        """
+        Pick the best fallback action, its confidence and extracted parameter.
+
+        The result depends only on the normalized command, so it is cached and
+        repeated commands ("feed my pet") skip the keyword scan entirely.
+
+        Args:
+            command_lower: Lowercased, stripped command text
+
+        Returns:
+            Tuple of (action or None, confidence, (parameter name, value) or None)
+        """
+        best_action = None
+        best_confidence = 0.0
+        midpoint = len(command_lower) / 2
+
+        # Find best matching action
+        for action, keywords in cls._KEYWORD_CONFIDENCES:
+            for keyword, base_confidence in keywords:
+                # One scan gives both the match and its position
+                keyword_pos = command_lower.find(keyword)
+                if keyword_pos >= 0:
+                    # Boost confidence if keyword appears early in command
+                    position_bonus = 0.1 if keyword_pos < midpoint else 0.0
+
+                    confidence = base_confidence + position_bonus
+
+                    if confidence > best_confidence:
+                        best_confidence = confidence
+                        best_action = action
+                    break
+
+        # Extract parameters based on action
+        rule = cls.PARAMETER_RULES.get(best_action)
+        if rule is None:
+            return best_action, best_confidence, None
+        param_name, options, default = rule
+        value = next(
+            (value for value, words in options if any(word in command_lower for word in words)),
+            default,
+        )
+        return best_action, best_confidence, (param_name, value)
+
     async def _process_with_fallback(
         self,
         command: str,
@@ -376,104 +477,19 @@ Consider the pet's current state when interpreting commands (e.g., low hunger mi
         """
         command_lower = command.lower().strip()
 
-        # Enhanced action keyword mapping with priority ordering
-        action_map = {
-            "feed": {
-                "keywords": ["feed", "give food", "hungry", "eat", "meal", "treat", "snack", "food"],
-                "high_priority": ["feed", "hungry", "eat"],
-            },
-            "play": {
-                "keywords": ["play", "game", "fetch", "toy", "fun", "exercise", "train"],
-                "high_priority": ["play", "game", "fetch"],
-            },
-            "bathe": {
-                "keywords": ["bathe", "bath", "clean", "wash", "groom", "shower"],
-                "high_priority": ["bathe", "bath", "clean"],
-            },
-            "rest": {
-                "keywords": ["rest", "sleep", "nap", "tired", "sleepy", "bed"],
-                "high_priority": ["rest", "sleep", "nap"],
-            },
-            "status": {
-                "keywords": ["status", "stats", "check", "how is", "health", "condition"],
-                "high_priority": ["status", "stats", "check"],
-            },
-            "shop": {
-                "keywords": ["shop", "store", "buy", "purchase", "market"],
-                "high_priority": ["shop", "store", "buy"],
-            },
-            "budget": {
-                "keywords": ["budget", "money", "coins", "balance", "finance", "spending"],
-                "high_priority": ["budget", "money", "balance"],
-            },
-        }
-
-        best_action = None
-        best_confidence = 0.0
-        parameters: Dict[str, Any] = {}
-
-        # Find best matching action
-        for action, config in action_map.items():
-            keywords = config["keywords"]
-            high_priority = config.get("high_priority", [])
-
-            for keyword in keywords:
-                if keyword in command_lower:
-                    # Calculate confidence: higher for high-priority keywords
-                    is_high_priority = keyword in high_priority
-                    base_confidence = 0.7 if is_high_priority else 0.5
-                    
-                    # Boost confidence if keyword appears early in command
-                    keyword_pos = command_lower.find(keyword)
-                    position_bonus = 0.1 if keyword_pos < len(command_lower) / 2 else 0.0
-                    
-                    confidence = base_confidence + position_bonus
-                    
-                    if confidence > best_confidence:
-                        best_confidence = confidence
-                        best_action = action
-                    break
-
-        # Extract parameters based on action
-        if best_action == "feed":
-            if "tuna" in command_lower:
-                parameters["food_type"] = "tuna"
-            elif any(word in command_lower for word in ["treat", "snack"]):
-                parameters["food_type"] = "treat"
-            else:
-                parameters["food_type"] = "standard"
-
-        elif best_action == "play":
-            if "fetch" in command_lower:
-                parameters["game_type"] = "fetch"
-            elif "puzzle" in command_lower:
-                parameters["game_type"] = "puzzle"
-            else:
-                parameters["game_type"] = "free_play"
-
-        elif best_action == "rest":
-            if any(word in command_lower for word in ["long", "overnight"]):
-                parameters["duration_hours"] = "8"
-            elif "nap" in command_lower:
-                parameters["duration_hours"] = "2"
-            else:
-                parameters["duration_hours"] = "4"
+        best_action, best_confidence, parameter = self._match_keywords(command_lower)
+        parameters: Dict[str, Any] = dict([parameter]) if parameter else {}
 
         # Handle no action found
         if not best_action:
-            suggestions = [
-                "Try: 'feed my pet'",
-                "Try: 'play with my pet'",
-                "Try: 'check status'",
-                "Try: 'bathe my pet'",
-            ]
-            
-            # Context-aware suggestions based on pet state
+            # Context-aware suggestions based on pet state go ahead of the defaults
+            suggestions: List[str] = []
             if pet_context:
-                if pet_context.get("hunger", 70) < 40:
-                    suggestions.insert(0, f"Your pet {pet_context.get('name', '')} might be hungry - try: 'feed my pet'")
                 if pet_context.get("energy", 70) < 40:
-                    suggestions.insert(0, f"Your pet might be tired - try: 'rest'")
+                    suggestions.append("Your pet might be tired - try: 'rest'")
+                if pet_context.get("hunger", 70) < 40:
+                    suggestions.append(f"Your pet {pet_context.get('name', '')} might be hungry - try: 'feed my pet'")
+            suggestions.extend(self.UNKNOWN_COMMAND_SUGGESTIONS)
 
             return {
                 "action": "unknown",
@@ -509,7 +525,7 @@ Consider the pet's current state when interpreting commands (e.g., low hunger mi
         """
         if session_id in self._conversation_context:
             del self._conversation_context[session_id]
-            logger.debug(f"Cleared conversation context for session {session_id}")
+            logger.debug("Cleared conversation context for session %s", session_id)
 
     def get_conversation_history(self, session_id: str) -> List[Dict[str, str]]:
         """
@@ -132,7 +132,7 @@ class UnifiedAIService:
                 pet_context=pet_context,
             )
         except Exception as e:
-            logger.error(f"Error processing NLP command: {e}", exc_info=True)
+            logger.error("Error processing NLP command: %s", e, exc_info=True)
             return {
                 "action": "unknown",
                 "confidence": 0.0,
@@ -180,7 +180,7 @@ class UnifiedAIService:
                 current_stats=current_stats,
             )
         except Exception as e:
-            logger.error(f"Error predicting behavior: {e}", exc_info=True)
+            logger.error("Error predicting behavior: %s", e, exc_info=True)
             return {
                 "mood_forecast": [],
                 "activity_prediction": [],
@@ -226,7 +226,7 @@ class UnifiedAIService:
                 existing_names=existing_names,
             )
         except Exception as e:
-            logger.error(f"Error validating name: {e}", exc_info=True)
+            logger.error("Error validating name: %s", e, exc_info=True)
             return {
                 "valid": False,
                 "errors": [f"Validation error: {str(e)}"],
@@ -271,7 +271,7 @@ class UnifiedAIService:
                 user_id=user_id,
             )
         except Exception as e:
-            logger.error(f"Error generating budget forecast: {e}", exc_info=True)
+            logger.error("Error generating budget forecast: %s", e, exc_info=True)
             return {
                 "monthly_forecast": [],
                 "category_forecast": {},
@@ -13,6 +13,7 @@ from app.middleware.authentication import JWTAuthenticationMiddleware
 from app.middleware.error_handler import error_handling_middleware
 from app.routers import api_router
 from app.routers.health import router as health_router
+from app.utils.dependencies import get_weather_service
 from app.utils.logging import configure_logging
 
 
@@ -23,6 +24,7 @@ async def lifespan(app: FastAPI):
     await connect_to_database(app)
     yield
     # Shutdown
+    await get_weather_service().aclose()
     await disconnect_from_database(app)
 
 
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PetStats:
     hunger: int
     hygiene: int
@@ -19,7 +19,7 @@ class PetStats:
     is_sick: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class PetDiaryEntry:
     id: str
     mood: str
@@ -27,7 +27,7 @@ class PetDiaryEntry:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Pet:
     id: str
     user_id: str
@@ -1,7 +1,7 @@
 """Accessory catalog and equipment endpoints."""
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.models import AuthenticatedUser
 from app.schemas import (
@@ -87,7 +87,5 @@ async def toggle_accessory(
 
 
 def raise_not_found() -> None:
-    from fastapi import HTTPException
-
     raise HTTPException(status.HTTP_404_NOT_FOUND, "Pet not found for accessory equip.")
 
@@ -13,8 +13,10 @@ from app.schemas.ai import (
     DecisionEvaluationResponse,
     FinanceScenarioRequest,
     FinanceScenarioResponse,
+    ForecastItem,
     HabitPredictionRequest,
     HabitPredictionResponse,
+    MoodForecastEntry,
     PetBehaviorRequest,
     PetBehaviorResponse,
     PetMoodForecastRequest,
@@ -144,7 +146,6 @@ async def get_budget_advice(
             advice = "Continue tracking expenses to identify spending patterns and optimize your budget."
         
         # Convert forecast items to response format
-        from app.schemas.ai import ForecastItem
         forecast_items = [
             ForecastItem(month=item["month"], predicted_spend=item["predicted_spend"])
             for item in forecast_result.get("monthly_forecast", [])
@@ -407,8 +408,6 @@ async def get_pet_mood_forecast(
 
     service = PetMoodForecastService()
     try:
-        from app.schemas.ai import MoodForecastEntry
-        
         forecast_data = await service.forecast_mood(
             pet_id=payload.pet_id,
             current_stats=payload.current_stats,
@@ -4,7 +4,7 @@ from __future__ import annotations
 from datetime import date, timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from asyncpg import Pool
 
 from app.core.jwt import get_current_user_id
@@ -89,7 +89,6 @@ async def export_analytics_csv(
         start_date = date.fromisoformat(start)
         end_date = date.fromisoformat(end)
     except ValueError as e:
-        from fastapi import HTTPException
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid date format: {str(e)}"
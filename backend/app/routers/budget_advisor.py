@@ -1,6 +1,7 @@
 """Budget advisor API endpoints."""
 from __future__ import annotations
 
+import logging
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -18,6 +19,8 @@ from app.schemas.ai import (
     TransactionHistoryItem,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/budget-advisor", tags=["Budget Advisor"])
 
 
@@ -181,9 +184,7 @@ async def analyze_budget(
         raise
     except Exception as e:
         # Log error and raise HTTP exception
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Budget analysis failed: {str(e)}", exc_info=True)
+        logger.error("Budget analysis failed: %s", e, exc_info=True)
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -52,8 +52,8 @@ async def get_event_detail(
 
 @weather_router.get("", response_model=WeatherResponse)
 async def get_weather(
-    lat: Optional[float] = Query(default=None, description="Latitude of the user."),
-    lon: Optional[float] = Query(default=None, description="Longitude of the user."),
+    lat: Optional[float] = Query(default=None, ge=-90, le=90, description="Latitude of the user."),
+    lon: Optional[float] = Query(default=None, ge=-180, le=180, description="Longitude of the user."),
     current_user: AuthenticatedUser = Depends(get_current_user),
     weather_service: WeatherService = Depends(get_weather_service),
 ) -> WeatherResponse:
@@ -1,8 +1,10 @@
 """Command-oriented pet interaction endpoints."""
 from __future__ import annotations
 
+import re
 from datetime import datetime
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
@@ -19,7 +21,11 @@ from app.utils.dependencies import get_current_user, get_pet_service
 
 router = APIRouter(prefix="/pet", tags=["pets"])
 
-ACTION_ALIASES: Dict[str, PetAction] = {
+# First whitespace-delimited run of decimal digits (anything int() parses), e.g. the "3" in "rest 3 hours"
+_DURATION_PATTERN = re.compile(r"(?<!\S)\d+(?!\S)")
+
+# Read-only: shared by every request in the worker
+ACTION_ALIASES: Mapping[str, PetAction] = MappingProxyType({
     "feed": PetAction.feed,
     "snack": PetAction.feed,
     "treat": PetAction.feed,
@@ -32,7 +38,16 @@ ACTION_ALIASES: Dict[str, PetAction] = {
     "groom": PetAction.bathe,
     "rest": PetAction.rest,
     "sleep": PetAction.rest,
-}
+})
+
+_MOOD_PERCENTS: Mapping[str, int] = MappingProxyType({
+    "ecstatic": 95,
+    "happy": 85,
+    "content": 70,
+    "anxious": 45,
+    "distressed": 25,
+    "ill": 20,
+})
 
 
 @router.post("/interact", response_model=PetInteractResponse, summary="Interact with the virtual pet via command")
@@ -41,14 +56,13 @@ async def interact_with_pet(
     current_user: AuthenticatedUser = Depends(get_current_user),
     pet_service: PetService = Depends(get_pet_service),
 ) -> PetInteractResponse:
-    pet = await pet_service.get_pet(current_user.id)
-    if pet is None:
-        raise HTTPException(status.HTTP_404_NOT_FOUND, "Pet not found.")
-
     session_id = payload.session_id or f"pet-session-{current_user.id}"
     normalized_action = payload.action.lower().strip()
 
     if normalized_action == "status":
+        pet = await pet_service.get_pet(current_user.id)
+        if pet is None:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, "Pet not found.")
         return PetInteractResponse(
             session_id=session_id,
             message=_render_status_summary(pet),
@@ -66,6 +80,7 @@ async def interact_with_pet(
             detail=f"Unsupported pet command '{payload.action}'. Try /feed, /play, /bathe, /rest, or /status.",
         )
 
+    # apply_action loads the pet itself and raises 404 when there is none
     action_request = _derive_action_request(pet_action, payload.message)
     action_response = await pet_service.apply_action(
         current_user.id,
@@ -101,10 +116,9 @@ def _derive_action_request(action: PetAction, message: str | None) -> PetActionR
         return PetActionRequest(game_type=message or "playtime")
     if action is PetAction.rest:
         duration = 1
-        if message:
-            tokens = [token for token in message.split() if token.isdigit()]
-            if tokens:
-                duration = max(1, min(12, int(tokens[0])))
+        match = _DURATION_PATTERN.search(message) if message else None
+        if match:
+            duration = max(1, min(12, int(match.group())))
         return PetActionRequest(duration_hours=duration)
     return PetActionRequest()
 
@@ -123,15 +137,7 @@ def _build_pet_state(pet: PetResponse) -> Dict[str, int | str]:
 
 
 def _mood_to_percent(mood: str) -> int:
-    mapping = {
-        "ecstatic": 95,
-        "happy": 85,
-        "content": 70,
-        "anxious": 45,
-        "distressed": 25,
-        "ill": 20,
-    }
-    return mapping.get(mood.lower(), 65)
+    return _MOOD_PERCENTS.get(mood.lower(), 65)
 
 
 def _format_reaction_message(pet: PetResponse, reaction: str, mood: str) -> str:
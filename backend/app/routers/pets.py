@@ -1,9 +1,10 @@
 """Pet management API routes."""
 from __future__ import annotations
 
+import logging
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.models import AuthenticatedUser
 from app.schemas import (
@@ -16,10 +17,13 @@ from app.schemas import (
     PetResponse,
     PetUpdate,
 )
+from app.services.game_loop_service import GameLoopService
 from app.services.pet_service import PetService
 from app.utils import get_current_user, get_pet_service, get_quest_service, get_shop_service
 from app.services.quest_service import QuestService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/pets", tags=["pets"])
 
 
@@ -79,14 +83,10 @@ async def perform_action(
                 await quest_service.update_progress(current_user.id, quest_key, 1)
             except Exception as quest_err:
                 # Log individual quest failures but continue
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.debug(f"Quest progress update skipped for {quest_key}: {quest_err}")
+                logger.debug("Quest progress update skipped for %s: %s", quest_key, quest_err)
     except Exception as e:
         # Log but don't fail the pet action if quest tracking fails
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.warning(f"Failed to track quest progress for action {action}: {e}")
+        logger.warning("Failed to track quest progress for action %s: %s", action, e)
     
     return response
 
@@ -123,9 +123,6 @@ async def process_game_loop(
     Process game loop updates (stat decay, idle coins, etc.).
     This endpoint can be called periodically or on login to catch up on missed time.
     """
-    from app.services.game_loop_service import GameLoopService
-    from app.utils import get_shop_service
-    
     # Create game loop service
     game_loop_service = GameLoopService(
         pool=None,  # Will use pet_service's pool
@@ -137,6 +134,4 @@ async def process_game_loop(
 
 
 def raise_status_not_found() -> None:
-    from fastapi import HTTPException
-
     raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Pet not found.")
@@ -1,7 +1,7 @@
 """Profile management API routes."""
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, File, UploadFile, status
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 
 from app.models import AuthenticatedUser
 from app.schemas import AvatarUploadResponse, ProfileCreate, ProfileResponse, ProfileUpdate
@@ -62,6 +62,4 @@ async def upload_avatar(
 
 
 def raise_status_not_found() -> None:
-    from fastapi import HTTPException
-
     raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Profile not found.")
@@ -21,6 +21,7 @@ from app.schemas.reports import (
     PDFExportResponse,
     ReportFilters,
 )
+from app.services.analytics_service import analytics_snapshot
 from app.services.report_service import generate_cost_forecast, generate_pdf_report
 
 router = APIRouter(prefix="/reports", tags=["Reports"])
@@ -123,8 +124,6 @@ async def get_filtered_report(
     
     # This endpoint would use the analytics service to return filtered data
     # For now, return a basic response structure
-    from app.services.analytics_service import analytics_snapshot
-    
     snapshot = await analytics_snapshot(pool, user_id)
     
     # Filter based on selected metrics if provided
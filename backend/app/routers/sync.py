@@ -24,7 +24,7 @@ async def get_cloud_state() -> Dict[str, Any]:
             "version": "1.0"
         }
     except Exception as e:
-        logger.error(f"Failed to fetch cloud state: {e}")
+        logger.error("Failed to fetch cloud state: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch cloud state"
@@ -39,10 +39,10 @@ async def push_cloud_state(
     try:
         # For now, just acknowledge receipt
         # In a real implementation, this would save to database
-        logger.info(f"Received state push")
+        logger.info("Received state push")
         return {"status": "success", "message": "State saved successfully"}
     except Exception as e:
-        logger.error(f"Failed to push cloud state: {e}")
+        logger.error("Failed to push cloud state: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to save cloud state"
@@ -49,7 +49,7 @@ class BudgetAIService:
         try:
             advice = await self._get_ai_advice(settings, transaction_summary, request.user_id)
         except Exception as e:
-            logger.error(f"Failed to get AI advice: {e}")
+            logger.error("Failed to get AI advice: %s", e)
             advice = self._fallback_advice_text(transaction_summary)
 
         return BudgetAdviceResponse(advice=advice, forecast=forecast)
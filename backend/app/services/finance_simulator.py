@@ -44,7 +44,7 @@ class FinanceSimulatorService:
             scenario = await self._get_ai_scenario(settings, scenario_type, user_context)
             return scenario
         except Exception as e:
-            logger.error(f"Failed to generate AI scenario: {e}")
+            logger.error("Failed to generate AI scenario: %s", e)
             return self._fallback_scenario(scenario_type)
 
     async def evaluate_decision(
@@ -74,7 +74,7 @@ class FinanceSimulatorService:
             evaluation = await self._get_ai_evaluation(settings, scenario_id, user_decision, scenario_context)
             return evaluation
         except Exception as e:
-            logger.error(f"Failed to evaluate decision: {e}")
+            logger.error("Failed to evaluate decision: %s", e)
             return self._fallback_evaluation(user_decision, scenario_context)
 
     async def _get_ai_scenario(
@@ -188,7 +188,7 @@ Return a JSON object with:
             scenario["generated_at"] = datetime.utcnow().isoformat()
             return scenario
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse AI scenario response: {e}")
+            logger.error("Failed to parse AI scenario response: %s", e)
             return self._fallback_scenario(scenario_type)
 
     async def _get_ai_evaluation(
@@ -283,7 +283,7 @@ Return a JSON object with:
             evaluation["scenario_id"] = scenario_id
             return evaluation
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse AI evaluation response: {e}")
+            logger.error("Failed to parse AI evaluation response: %s", e)
             return self._fallback_evaluation(user_decision, scenario_context)
 
     def _fallback_scenario(self, scenario_type: str) -> Dict[str, Any]:
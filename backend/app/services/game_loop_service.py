@@ -5,6 +5,7 @@ Processes game state updates server-side for consistency and reliability.
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
@@ -12,9 +13,12 @@ from asyncpg import Pool
 from fastapi import HTTPException, status
 
 from app.models import AuthenticatedUser
+from app.schemas import PetUpdate
 from app.services.pet_service import PetService
 from app.services.shop_service import ShopService
 
+logger = logging.getLogger(__name__)
+
 
 class GameLoopService:
     """Handles periodic game state updates server-side."""
@@ -77,8 +81,6 @@ class GameLoopService:
 
         # Update pet stats if there are changes
         if decay_updates:
-            from app.schemas import PetUpdate
-
             update_payload = PetUpdate(**decay_updates)
             await self._pet_service.update_pet(user_id, update_payload)
 
@@ -225,9 +227,7 @@ class GameLoopService:
             return coins_to_award
         except Exception as e:
             # Log error but don't fail the game loop
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error awarding idle coins: {e}")
+            logger.error("Error awarding idle coins: %s", e)
             return 0
 
     async def _require_pool(self) -> Pool:
@@ -12,6 +12,9 @@ from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Time-of-day bucket for each hour 0-23
+_TIME_PERIODS = ("night",) * 6 + ("morning",) * 6 + ("afternoon",) * 6 + ("evening",) * 4 + ("night",) * 2
+
 
 class HabitPredictionService:
     """Service for predicting user habits based on interaction patterns."""
@@ -52,7 +55,7 @@ class HabitPredictionService:
             predictions = await self._get_ai_habit_predictions(settings, habit_data, user_id, forecast_days)
             return predictions
         except Exception as e:
-            logger.error(f"Failed to get AI habit predictions: {e}")
+            logger.error("Failed to get AI habit predictions: %s", e)
             return self._fallback_habit_prediction(interaction_history, forecast_days)
 
     def _prepare_habit_data(
@@ -72,6 +75,7 @@ class HabitPredictionService:
         # Analyze daily patterns
         daily_patterns: Dict[str, Dict[str, Any]] = {}
         action_frequency: Dict[str, int] = {}
+        timestamps: List[datetime] = []
 
         for interaction in interaction_history:
             timestamp = interaction.get("timestamp", "")
@@ -79,6 +83,7 @@ class HabitPredictionService:
 
             try:
                 dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+                timestamps.append(dt)
                 day_of_week = dt.strftime("%A")
                 hour = dt.hour
 
@@ -95,7 +100,7 @@ class HabitPredictionService:
                 action_frequency[action] = action_frequency.get(action, 0) + 1
 
                 # Track time of day patterns
-                time_period = "morning" if 6 <= hour < 12 else "afternoon" if 12 <= hour < 18 else "evening" if 18 <= hour < 22 else "night"
+                time_period = _TIME_PERIODS[hour]
                 if "time_periods" not in day_pattern:
                     day_pattern["time_periods"] = {}
                 time_periods = day_pattern["time_periods"]
@@ -106,15 +111,7 @@ class HabitPredictionService:
 
         # Calculate care consistency (how regularly user interacts)
         if len(interaction_history) > 1:
-            timestamps = []
-            for interaction in interaction_history:
-                try:
-                    timestamp = interaction.get("timestamp", "")
-                    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                    timestamps.append(dt)
-                except (ValueError, AttributeError):
-                    continue
-
+            # Timestamps were parsed once in the pattern pass above
             if len(timestamps) > 1:
                 timestamps.sort()
                 intervals = [(timestamps[i + 1] - timestamps[i]).total_seconds() / 3600 for i in range(len(timestamps) - 1)]
@@ -131,7 +128,7 @@ class HabitPredictionService:
             "daily_patterns": daily_patterns,
             "action_frequency": action_frequency,
             "care_consistency": consistency,
-            "most_active_day": max(daily_patterns.items(), key=lambda x: sum(x[1].values()) if isinstance(x[1], dict) else 0)[0] if daily_patterns else None,
+            "most_active_day": max(daily_patterns.items(), key=lambda x: sum(v for v in x[1].values() if isinstance(v, int)) if isinstance(x[1], dict) else 0)[0] if daily_patterns else None,
             "most_common_action": max(action_frequency.items(), key=lambda x: x[1])[0] if action_frequency else None,
         }
 
@@ -222,7 +219,7 @@ Return a JSON object with:
                 "generated_at": datetime.utcnow().isoformat(),
             }
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse AI habit prediction response: {e}")
+            logger.error("Failed to parse AI habit prediction response: %s", e)
             return self._fallback_habit_prediction([], forecast_days)
 
     def _fallback_habit_prediction(
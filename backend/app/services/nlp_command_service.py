@@ -16,6 +16,23 @@ logger = logging.getLogger(__name__)
 class NLPCommandService:
     """Enhanced NLP service with context-aware command processing and OpenAI fallback."""
 
+    # Fallback keywords per action, in priority order; built once at import
+    ACTION_KEYWORDS = (
+        ("feed", ("feed", "give food", "hungry", "eat", "meal")),
+        ("play", ("play", "game", "fetch", "toy", "fun")),
+        ("bathe", ("bathe", "bath", "clean", "wash", "groom")),
+        ("rest", ("rest", "sleep", "nap", "tired", "sleepy")),
+        ("status", ("status", "stats", "check", "how is", "health")),
+        ("shop", ("shop", "store", "buy", "purchase")),
+        ("budget", ("budget", "money", "coins", "balance", "finance")),
+    )
+    UNKNOWN_COMMAND_SUGGESTIONS = (
+        "Try: 'feed my pet'",
+        "Try: 'play with my pet'",
+        "Try: 'check status'",
+        "Try: 'bathe my pet'",
+    )
+
     def __init__(self, client: httpx.AsyncClient | None = None) -> None:
         self._client = client or httpx.AsyncClient(timeout=30.0)
         self._conversation_context: Dict[str, List[Dict[str, str]]] = {}
@@ -56,7 +73,7 @@ class NLPCommandService:
                     command, session_id, pet_context, settings
                 )
             except Exception as e:
-                logger.warning(f"OpenAI processing failed, using fallback: {e}")
+                logger.warning("OpenAI processing failed, using fallback: %s", e)
 
         # Fallback to rule-based parsing
         return await self._process_with_fallback(command, session_id, pet_context)
@@ -156,7 +173,7 @@ If the command is unclear, set needs_clarification to true and provide helpful s
                 "fallback_used": False,
             }
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse OpenAI response: {e}")
+            logger.error("Failed to parse OpenAI response: %s", e)
             raise
 
     async def _process_with_fallback(
@@ -168,24 +185,15 @@ If the command is unclear, set needs_clarification to true and provide helpful s
         """Fallback rule-based command processing."""
         command_lower = command.lower().strip()
 
-        # Simple pattern matching
-        action_map = {
-            "feed": ["feed", "give food", "hungry", "eat", "meal"],
-            "play": ["play", "game", "fetch", "toy", "fun"],
-            "bathe": ["bathe", "bath", "clean", "wash", "groom"],
-            "rest": ["rest", "sleep", "nap", "tired", "sleepy"],
-            "status": ["status", "stats", "check", "how is", "health"],
-            "shop": ["shop", "store", "buy", "purchase"],
-            "budget": ["budget", "money", "coins", "balance", "finance"],
-        }
-
         best_action = None
         best_confidence = 0.0
+        command_length = len(command_lower)
 
-        for action, keywords in action_map.items():
+        # Simple pattern matching
+        for action, keywords in self.ACTION_KEYWORDS:
             for keyword in keywords:
                 if keyword in command_lower:
-                    confidence = len(keyword) / len(command_lower)  # Simple confidence metric
+                    confidence = len(keyword) / command_length  # Simple confidence metric
                     if confidence > best_confidence:
                         best_confidence = confidence
                         best_action = action
@@ -193,19 +201,13 @@ If the command is unclear, set needs_clarification to true and provide helpful s
 
         if not best_action:
             # No clear action found
-            suggestions = [
-                "Try: 'feed my pet'",
-                "Try: 'play with my pet'",
-                "Try: 'check status'",
-                "Try: 'bathe my pet'",
-            ]
             return {
                 "action": "unknown",
                 "confidence": 0.0,
                 "parameters": {},
                 "intent": "Could not understand command",
                 "needs_clarification": True,
-                "suggestions": suggestions,
+                "suggestions": list(self.UNKNOWN_COMMAND_SUGGESTIONS),
                 "error": "Command not recognized",
                 "fallback_used": True,
             }
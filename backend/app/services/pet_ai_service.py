@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+import random
+import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
@@ -20,7 +22,7 @@ except Exception:  # pragma: no cover - MCP optional fallback
     default_context_manager = None  # type: ignore[assignment]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReactionResult:
     reaction: str
     mood: Optional[str]
@@ -30,7 +32,27 @@ class ReactionResult:
 
 
 class PetAIService:
-    """Integrates with Llama 4 Scout via OpenRouter to provide adaptive responses."""
+    """Integrates with Llama 4 Scout via OpenRouter to provide adaptive responses.
+
+    The circuit breaker is deliberately process-wide: a service is built per
+    request, so its failure count and cooldown live on the class and are shared
+    by every instance in the worker. Tests reset it with ``_reset_breaker()``.
+    """
+
+    # Circuit breaker state lives on the class because a service is built per request
+    _BREAKER_FAILURE_THRESHOLD = 5
+    _BREAKER_RESET_SECONDS = 60.0
+    _breaker_failures = 0
+    _breaker_open_until = 0.0
+
+    # Canned reactions used when the AI call is unavailable
+    _FALLBACK_REACTIONS: Dict[str, str] = {
+        "feed": "laps up the meal happily!",
+        "play": "chirps with delight after the game!",
+        "bathe": "shakes off the bubbles, looking refreshed!",
+        "rest": "snoozes peacefully and stretches contently!",
+    }
+    _DEFAULT_FALLBACK_REACTION = "seems appreciative of your care!"
 
     def __init__(
         self,
@@ -101,6 +123,9 @@ class PetAIService:
         headers: Dict[str, str],
         payload: Dict[str, Any],
     ) -> httpx.Response:
+        if self._breaker_is_open():
+            raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, "AI reaction service unavailable")
+
         client = self._client or httpx.AsyncClient()
         close_client = self._client is None
         last_error: Optional[Exception] = None
@@ -114,6 +139,7 @@ class PetAIService:
                         timeout=30.0,
                     )
                     if response.status_code < 500:
+                        self._record_breaker_success()
                         return response
                     last_error = HTTPException(
                         status_code=response.status_code,
@@ -121,17 +147,41 @@ class PetAIService:
                     )
                 except httpx.RequestError as exc:
                     last_error = exc
-                await asyncio.sleep(0.5 * attempt)
+                if attempt < self._max_retries:
+                    # Jitter keeps concurrent requests from retrying in lockstep
+                    await asyncio.sleep(0.5 * attempt * random.uniform(0.5, 1.5))
         finally:
             if close_client:
                 await client.aclose()
 
+        self._record_breaker_failure()
         if isinstance(last_error, HTTPException):
             raise last_error
         if last_error:
             raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, "AI reaction service unavailable") from last_error
         raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, "AI reaction service unavailable")
 
+    @classmethod
+    def _reset_breaker(cls) -> None:
+        cls._breaker_failures = 0
+        cls._breaker_open_until = 0.0
+
+    @classmethod
+    def _breaker_is_open(cls) -> bool:
+        return time.monotonic() < cls._breaker_open_until
+
+    @classmethod
+    def _record_breaker_success(cls) -> None:
+        cls._breaker_failures = 0
+
+    @classmethod
+    def _record_breaker_failure(cls) -> None:
+        cls._breaker_failures += 1
+        if cls._breaker_failures >= cls._BREAKER_FAILURE_THRESHOLD:
+            # Stop calling a gateway that keeps failing until the cooldown passes
+            cls._breaker_open_until = time.monotonic() + cls._BREAKER_RESET_SECONDS
+            cls._breaker_failures = 0
+
     async def generate_reaction(
         self,
         user_id: str,
@@ -302,13 +352,7 @@ class PetAIService:
         action = context.get("action", "interaction")
         after_stats = context.get("after", {}) or {}
         mood = after_stats.get("mood")
-        reaction_map = {
-            "feed": "laps up the meal happily!",
-            "play": "chirps with delight after the game!",
-            "bathe": "shakes off the bubbles, looking refreshed!",
-            "rest": "snoozes peacefully and stretches contently!",
-        }
-        reaction = reaction_map.get(action, "seems appreciative of your care!")
+        reaction = self._FALLBACK_REACTIONS.get(action, self._DEFAULT_FALLBACK_REACTION)
         health_forecast = self._predict_health(after_stats)
         return ReactionResult(
             reaction=reaction,
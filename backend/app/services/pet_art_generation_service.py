@@ -5,10 +5,11 @@ import base64
 import json
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
-from hashlib import sha256
+from hashlib import blake2b
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import httpx
+import orjson
 from asyncpg import Pool
 from fastapi import HTTPException, status
 
@@ -272,7 +273,7 @@ class PetArtService:
         accessories: Sequence[Dict[str, str]],
     ) -> str:
         sorted_accessories = sorted(accessories, key=lambda item: item.get("accessory_id", ""))
-        payload = json.dumps(
+        payload = orjson.dumps(
             {
                 "user_id": user_id,
                 "pet_id": pet_id,
@@ -280,9 +281,10 @@ class PetArtService:
                 "style": style,
                 "accessories": sorted_accessories,
             },
-            sort_keys=True,
+            option=orjson.OPT_SORT_KEYS,
         )
-        return sha256(payload.encode("utf-8")).hexdigest()
+        # Cache key only, not a security token; a 32-byte digest keeps the 64-char hex shape
+        return blake2b(payload, digest_size=32).hexdigest()
 
     def _row_to_entry(self, row) -> PetArtCacheEntry:
         metadata = row["metadata"]
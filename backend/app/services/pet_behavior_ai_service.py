@@ -55,7 +55,7 @@ class PetBehaviorAIService:
                 activity_prediction = self._generate_fallback_activity_prediction(request.interaction_history)
 
         except Exception as e:
-            logger.error(f"Failed to get AI predictions: {e}")
+            logger.error("Failed to get AI predictions: %s", e)
             mood_forecast = self._generate_fallback_mood_forecast(request.interaction_history)
             activity_prediction = self._generate_fallback_activity_prediction(request.interaction_history)
 
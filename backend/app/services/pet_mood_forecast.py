@@ -52,7 +52,7 @@ class PetMoodForecastService:
             forecast = await self._get_ai_forecast(settings, analysis_data, pet_id, forecast_days)
             return forecast
         except Exception as e:
-            logger.error(f"Failed to get AI forecast: {e}")
+            logger.error("Failed to get AI forecast: %s", e)
             return self._fallback_forecast(current_stats, forecast_days)
 
     def _prepare_analysis_data(
@@ -198,7 +198,7 @@ Example format:
             
             return formatted_forecast
         except (json.JSONDecodeError, KeyError, ValueError) as e:
-            logger.error(f"Failed to parse AI forecast response: {e}")
+            logger.error("Failed to parse AI forecast response: %s", e)
             return self._fallback_forecast(analysis_data["current_stats"], forecast_days)
 
     def _fallback_forecast(
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import List
 
 import httpx
@@ -11,12 +12,17 @@ from app.schemas.ai import PetNameSuggestionRequest, PetNameSuggestionResponse
 
 logger = logging.getLogger(__name__)
 
-# List of offensive/inappropriate words (basic filter)
-OFFENSIVE_WORDS = {
-    "badword1",
-    "badword2",
-    # Add more as needed - in production, use a comprehensive profanity filter library
-}
+# List of offensive/inappropriate words (basic filter), lowercased and frozen at import
+OFFENSIVE_WORDS = frozenset(
+    word.lower()
+    for word in (
+        "badword1",
+        "badword2",
+        # Add more as needed - in production, use a comprehensive profanity filter library
+    )
+)
+# Single alternation over all words, longest first, so a name is scanned once
+_OFFENSIVE_PATTERN = re.compile("|".join(map(re.escape, sorted(OFFENSIVE_WORDS, key=len, reverse=True))))
 
 
 class PetNameAIService:
@@ -49,7 +55,7 @@ class PetNameAIService:
             try:
                 suggestions = await self._generate_ai_suggestions(input_name, is_valid)
             except Exception as e:
-                logger.error(f"Failed to generate AI suggestions: {e}")
+                logger.error("Failed to generate AI suggestions: %s", e)
                 suggestions = self._fallback_suggestions(input_name)
 
         # Limit to 5 suggestions
@@ -72,10 +78,8 @@ class PetNameAIService:
             return False
 
         # Check for offensive words (case-insensitive)
-        name_lower = name.lower()
-        for word in OFFENSIVE_WORDS:
-            if word in name_lower:
-                return False
+        if OFFENSIVE_WORDS and _OFFENSIVE_PATTERN.search(name.lower()):
+            return False
 
         # Basic character validation (allow letters, numbers, spaces, hyphens, apostrophes)
         if not all(c.isalnum() or c in (" ", "-", "'") for c in name):
@@ -139,8 +143,8 @@ Return only the names, one per line, without numbering or bullets."""
 
         # Parse suggestions from response
         suggestions = [line.strip() for line in content.split("\n") if line.strip()]
-        # Filter out any that are too long or invalid
-        suggestions = [s for s in suggestions if 1 <= len(s) <= 20 and self._validate_name(s)]
+        # Filter out invalid names (_validate_name already enforces the length bounds)
+        suggestions = [s for s in suggestions if self._validate_name(s)]
 
         return suggestions[:5]
 
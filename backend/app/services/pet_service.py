@@ -1,6 +1,8 @@
 """Service layer handling pet state transitions and persistence."""
 from __future__ import annotations
 
+import json
+from dataclasses import asdict
 from typing import Any, Dict, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 
@@ -28,6 +30,53 @@ from app.services.seasonal_service import SeasonalReactionsService
 class PetService:
     """Orchestrates pet CRUD, actions, and diary logging."""
 
+    # Logical stat -> physical column candidates, in preference order
+    _COLUMN_CANDIDATES: Dict[str, Tuple[str, ...]] = {
+        "hunger": ("hunger",),
+        "hygiene": ("hygiene", "cleanliness"),
+        "energy": ("energy",),
+        "mood": ("mood", "happiness"),
+        "health": ("health",),
+        "xp": ("xp", "experience"),
+        "level": ("level",),
+        "color": ("color", "color_pattern"),
+    }
+    _OPTIONAL_COLUMNS = frozenset({"color"})
+    _CANDIDATE_COLUMN_NAMES = tuple(name for candidates in _COLUMN_CANDIDATES.values() for name in candidates)
+    # Per-action "last performed" timestamp column, stamped when present on the table
+    _ACTION_TIMESTAMP_COLUMNS: Dict[PetAction, str] = {
+        PetAction.feed: "last_fed",
+        PetAction.play: "last_played",
+        PetAction.bathe: "last_bathed",
+        PetAction.rest: "last_slept",
+    }
+    _TIMESTAMP_COLUMN_NAMES = tuple(_ACTION_TIMESTAMP_COLUMNS.values())
+    # Fixed per-action effects: (hunger, hygiene, energy, health, xp, reaction, diary note).
+    # Rest scales with its duration and is handled separately.
+    _ACTION_EFFECTS: Dict[PetAction, Tuple[int, int, int, int, int, str, str]] = {
+        PetAction.feed: (25, -5, 5, 5, 15, "delighted munching", "Enjoyed a {food_type}."),
+        PetAction.play: (-10, -10, -15, 3, 20, "joyful playtime", "Played {game_type}."),
+        PetAction.bathe: (0, 30, -5, 4, 10, "sparkling clean", "Took a refreshing bath."),
+    }
+    # Per-unit shop item effects by category. Toys stand in for happiness, which
+    # has no stat of its own, by lifting energy at the cost of some hunger.
+    _SHOP_ITEM_EFFECTS: Dict[str, Dict[str, int]] = {
+        "food": {"hunger": 20, "health": 5, "xp": 5},
+        "medicine": {"health": 30, "xp": 3},
+        "toy": {"energy": 10, "hunger": -5, "xp": 10},
+        "energy": {"energy": 40, "xp": 3},
+    }
+    _EVOLUTION_MESSAGES: Dict[EvolutionStage, str] = {
+        EvolutionStage.egg: "{name} has evolved to Egg stage! 🎉",
+        EvolutionStage.juvenile: "{name} has evolved to Juvenile stage! 🎉",
+        EvolutionStage.adult: "{name} has evolved to Adult stage! 🎉",
+        EvolutionStage.legendary: "{name} has evolved to Legendary stage! 🎉",
+    }
+
+    # The diary DDL is idempotent, so one successful run per process is enough;
+    # the flag lives on the class because a service is built per request.
+    _infrastructure_ready = False
+
     def __init__(
         self,
         pool: Optional[Pool],
@@ -36,8 +85,12 @@ class PetService:
     ) -> None:
         self._pool = pool
         self._column_map: Optional[Dict[str, Optional[str]]] = None
+        self._timestamp_columns: Tuple[str, ...] = ()
         self._ai_service = ai_service
         self._seasonal_service = seasonal_service
+        # Request-scoped memo of get_pet results (the service is created per request);
+        # entries are dropped whenever this service writes to the pet or its diary.
+        self._pet_cache: Dict[str, PetResponse] = {}
 
     async def _require_pool(self) -> Pool:
         if self._pool is None:
@@ -47,6 +100,8 @@ class PetService:
     async def _ensure_infrastructure(self, connection) -> None:
         if self._column_map is None:
             await self._detect_columns(connection)
+        if PetService._infrastructure_ready:
+            return
         await connection.execute(
             """
             CREATE TABLE IF NOT EXISTS pet_diary_entries (
@@ -65,80 +120,48 @@ class PetService:
             ON pet_diary_entries(pet_id, created_at DESC)
             """
         )
+        PetService._infrastructure_ready = True
 
     async def _detect_columns(self, connection) -> None:
+        # Only ask for the stat and action timestamp columns instead of the whole table definition
         rows = await connection.fetch(
             """
             SELECT column_name
             FROM information_schema.columns
             WHERE table_schema = 'public' AND table_name = 'pets'
-            """
+            AND column_name = ANY($1::text[])
+            """,
+            self._CANDIDATE_COLUMN_NAMES + self._TIMESTAMP_COLUMN_NAMES,
         )
         available = {row["column_name"] for row in rows}
+        self._timestamp_columns = tuple(name for name in self._TIMESTAMP_COLUMN_NAMES if name in available)
 
-        def locate(*candidates: str, required: bool = True, default: Optional[str] = None) -> Optional[str]:
-            for candidate in candidates:
-                if candidate in available:
-                    return candidate
-            if required and default is None:
+        column_map: Dict[str, Optional[str]] = {}
+        for key, candidates in self._COLUMN_CANDIDATES.items():
+            column = next((candidate for candidate in candidates if candidate in available), None)
+            if column is None and key not in self._OPTIONAL_COLUMNS:
                 raise HTTPException(
                     status.HTTP_500_INTERNAL_SERVER_ERROR,
                     f"Pets table missing required columns: one of {candidates}.",
                 )
-            return default
-
-        self._column_map = {
-            "hunger": locate("hunger"),
-            "hygiene": locate("hygiene", "cleanliness"),
-            "energy": locate("energy"),
-            "mood": locate("mood", "happiness"),
-            "health": locate("health"),
-            "xp": locate("xp", "experience"),
-            "level": locate("level"),
-            "color": locate("color", "color_pattern", required=False),
-        }
+            column_map[key] = column
+        self._column_map = column_map
 
     async def get_pet(self, user_id: str) -> Optional[PetResponse]:
+        cached = self._pet_cache.get(user_id)
+        if cached is not None:
+            # Hand out a copy so callers cannot mutate the memoized response
+            return cached.model_copy(deep=True)
+
         pool = await self._require_pool()
         async with pool.acquire() as connection:
             await self._ensure_infrastructure(connection)
             columns = self._column_map
             assert columns is not None
             color_column = columns["color"]
-            # Check for timestamp columns for stat decay calculations
-            timestamp_columns: list[str] = []
-            row_check = await connection.fetchrow(
-                """
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_schema = 'public' AND table_name = 'pets'
-                AND column_name IN ('last_fed', 'last_played', 'last_bathed', 'last_slept', 'updated_at')
-                """
-            )
-            available_timestamps = set()
-            if row_check:
-                timestamp_rows = await connection.fetch(
-                    """
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_schema = 'public' AND table_name = 'pets'
-                    AND column_name IN ('last_fed', 'last_played', 'last_bathed', 'last_slept', 'updated_at')
-                    """
-                )
-                available_timestamps = {row['column_name'] for row in timestamp_rows}
-            
-            timestamp_selects = []
-            if 'last_fed' in available_timestamps:
-                timestamp_selects.append('p.last_fed')
-            if 'last_played' in available_timestamps:
-                timestamp_selects.append('p.last_played')
-            if 'last_bathed' in available_timestamps:
-                timestamp_selects.append('p.last_bathed')
-            if 'last_slept' in available_timestamps:
-                timestamp_selects.append('p.last_slept')
-            
+            timestamp_selects = [f'p.{name}' for name in self._timestamp_columns]
             timestamp_clause = ', ' + ', '.join(timestamp_selects) if timestamp_selects else ''
-            
+
             row = await connection.fetchrow(
                 f"""
                 SELECT
@@ -157,8 +180,19 @@ class PetService:
                     p.{columns['health']} AS health,
                     p.{columns['xp']} AS xp,
                     p.{columns['level']} AS level
-                    {timestamp_clause}
+                    {timestamp_clause},
+                    recent.entries AS diary_entries
                 FROM pets p
+                LEFT JOIN LATERAL (
+                    SELECT json_agg(d ORDER BY d.created_at DESC) AS entries
+                    FROM (
+                        SELECT id, mood, note, created_at
+                        FROM pet_diary_entries
+                        WHERE user_id = p.user_id AND pet_id = p.id
+                        ORDER BY created_at DESC
+                        LIMIT 20
+                    ) d
+                ) recent ON TRUE
                 WHERE p.user_id = $1
                 """,
                 user_id,
@@ -166,19 +200,7 @@ class PetService:
             if row is None:
                 return None
 
-            diary_rows = await connection.fetch(
-                """
-                SELECT id, mood, note, created_at
-                FROM pet_diary_entries
-                WHERE user_id = $1 AND pet_id = $2
-                ORDER BY created_at DESC
-                LIMIT 20
-                """,
-                user_id,
-                row["id"],
-            )
-
-        pet = self._row_to_domain(row, diary_rows)
+        pet = self._row_to_domain(row, self._decode_diary_entries(row["diary_entries"]))
         
         # Apply stat decay based on time elapsed since last update
         decay_applied = False
@@ -192,10 +214,22 @@ class PetService:
         if decay_applied:
             await self._persist_pet_state(user_id, pet)
         
+        seasonal_state = await self._apply_seasonal_adjustments(user_id, pet)
+        response = self._domain_to_response(pet, seasonal_state)
+        self._pet_cache[user_id] = response.model_copy(deep=True)
+        return response
+
+    def _invalidate_pet(self, user_id: str) -> None:
+        self._pet_cache.pop(user_id, None)
+
+    async def _persisted_pet_response(self, user_id: str, pet: Pet) -> PetResponse:
+        # Build the response from the state just written instead of re-reading the row.
+        # The seasonal modifiers are re-applied so the stats match an immediate get_pet.
         seasonal_state = await self._apply_seasonal_adjustments(user_id, pet)
         return self._domain_to_response(pet, seasonal_state)
 
     async def create_pet(self, user_id: str, payload: PetCreate) -> PetResponse:
+        self._invalidate_pet(user_id)
         pool = await self._require_pool()
         async with pool.acquire() as connection:
             await self._ensure_infrastructure(connection)
@@ -293,6 +327,7 @@ class PetService:
                 user_id,
                 *updates.values(),
             )
+        self._invalidate_pet(user_id)
         pet = await self.get_pet(user_id)
         if pet is None:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "Pet not found.")
@@ -340,10 +375,12 @@ class PetService:
             )
 
         if diary_entry is not None:
-            await self.add_diary_entry(user_id, updated_pet.id, diary_entry)
+            created = await self.add_diary_entry(user_id, updated_pet.id, diary_entry)
+            updated_pet.diary = [PetDiaryEntry(**created.model_dump()), *updated_pet.diary][:20]
 
-        refreshed = await self.get_pet(user_id)
-        assert refreshed is not None
+        health_forecast = reaction_result.health_forecast or self._compute_health_forecast(updated_pet.stats)
+        updated_pet.updated_at = datetime.now(timezone.utc)
+        refreshed = await self._persisted_pet_response(user_id, updated_pet)
         refreshed.stats.mood = final_mood  # ensure response reflects calculated mood
         if refreshed.seasonal_state is not None:
             refreshed.seasonal_state.mood = final_mood
@@ -352,15 +389,34 @@ class PetService:
             reaction=reaction_text,
             mood=final_mood,
             notifications=reaction_result.notifications,
-            health_forecast=reaction_result.health_forecast
-            or self._compute_health_forecast(updated_pet.stats),
+            health_forecast=health_forecast,
         )
 
     async def get_diary(self, user_id: str) -> list[PetDiaryEntryResponse]:
-        pet = await self.get_pet(user_id)
-        if pet is None:
-            raise HTTPException(status.HTTP_404_NOT_FOUND, "Pet not found.")
-        return pet.diary
+        cached = self._pet_cache.get(user_id)
+        if cached is not None:
+            return [entry.model_copy() for entry in cached.diary]
+
+        # Only the pet id is needed here; skip the full pet load with its decay
+        # and seasonal lookups.
+        pool = await self._require_pool()
+        async with pool.acquire() as connection:
+            await self._ensure_infrastructure(connection)
+            pet_id = await connection.fetchval("SELECT id FROM pets WHERE user_id = $1", user_id)
+            if pet_id is None:
+                raise HTTPException(status.HTTP_404_NOT_FOUND, "Pet not found.")
+            diary_rows = await connection.fetch(
+                """
+                SELECT id, mood, note, created_at
+                FROM pet_diary_entries
+                WHERE user_id = $1 AND pet_id = $2
+                ORDER BY created_at DESC
+                LIMIT 20
+                """,
+                user_id,
+                pet_id,
+            )
+        return [self._diary_row_to_response(row) for row in diary_rows]
 
     async def add_diary_entry(
         self,
@@ -368,6 +424,7 @@ class PetService:
         pet_id: str,
         payload: PetDiaryCreate,
     ) -> PetDiaryEntryResponse:
+        self._invalidate_pet(user_id)
         pool = await self._require_pool()
         async with pool.acquire() as connection:
             await self._ensure_infrastructure(connection)
@@ -382,7 +439,7 @@ class PetService:
                 payload.mood,
                 payload.note,
             )
-        return PetDiaryEntryResponse(**dict(row))
+        return self._diary_row_to_response(row)
 
     async def apply_shop_item_effects(
         self,
@@ -401,24 +458,11 @@ class PetService:
         pet = self._response_to_domain(pet_response)
         stats = pet.stats
         
-        # Apply effects based on item category
-        for _ in range(quantity):
-            if item_category == 'food':
-                stats.hunger = self._clamp(stats.hunger + 20)
-                stats.health = self._clamp(stats.health + 5)
-                stats.xp += 5
-            elif item_category == 'medicine':
-                stats.health = self._clamp(stats.health + 30)
-                stats.xp += 3
-            elif item_category == 'toy':
-                # Toy increases happiness (which affects mood)
-                # Since we don't have a separate happiness stat, we increase multiple stats
-                stats.energy = self._clamp(stats.energy + 10)
-                stats.hunger = self._clamp(stats.hunger - 5)  # Playing burns energy
-                stats.xp += 10
-            elif item_category == 'energy':
-                stats.energy = self._clamp(stats.energy + 40)
-                stats.xp += 3
+        # Apply effects based on item category; stats are clamped, XP is not
+        units = max(quantity, 0)
+        for stat, delta in self._SHOP_ITEM_EFFECTS.get(item_category, {}).items():
+            value = getattr(stats, stat) + delta * units
+            setattr(stats, stat, value if stat == "xp" else self._clamp(value))
         
         # Recalculate level and evolution
         stats.xp, stats.level = self._recalculate_level(stats.xp, stats.level)
@@ -443,10 +487,7 @@ class PetService:
         )
         
         await self._persist_pet_state(user_id, updated_pet)
-        
-        refreshed = await self.get_pet(user_id)
-        assert refreshed is not None
-        return refreshed
+        return await self._persisted_pet_response(user_id, updated_pet)
 
     async def apply_quest_rewards(
         self,
@@ -474,11 +515,12 @@ class PetService:
             # Check for evolution
             evolution_msg = self._check_evolution(pet, old_level, stats.level)
             if evolution_msg:
-                await self.add_diary_entry(
+                created = await self.add_diary_entry(
                     user_id,
                     pet.id,
                     PetDiaryCreate(mood="ecstatic", note=evolution_msg),
                 )
+                pet.diary = [PetDiaryEntry(**created.model_dump()), *pet.diary][:20]
         
         # Apply stat boosts
         if stat_boosts:
@@ -511,10 +553,7 @@ class PetService:
         )
         
         await self._persist_pet_state(user_id, updated_pet)
-        
-        refreshed = await self.get_pet(user_id)
-        assert refreshed is not None
-        return refreshed
+        return await self._persisted_pet_response(user_id, updated_pet)
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -536,30 +575,18 @@ class PetService:
         note: Optional[str] = None
         reaction = ""
 
-        if action is PetAction.feed:
-            hunger = self._clamp(hunger + 25)
-            energy = self._clamp(energy + 5)
-            hygiene = self._clamp(hygiene - 5)
-            health = self._clamp(health + 5)
-            xp += 15
-            reaction = "delighted munching"
-            note = f"Enjoyed a {payload.food_type or 'meal'}."
-            # Update last_fed timestamp will be handled in _persist_pet_state if column exists
-        elif action is PetAction.play:
-            hunger = self._clamp(hunger - 10)
-            energy = self._clamp(energy - 15)
-            hygiene = self._clamp(hygiene - 10)
-            health = self._clamp(health + 3)
-            xp += 20
-            reaction = "joyful playtime"
-            note = f"Played {payload.game_type or 'together'}."
-        elif action is PetAction.bathe:
-            hygiene = self._clamp(hygiene + 30)
-            energy = self._clamp(energy - 5)
-            health = self._clamp(health + 4)
-            xp += 10
-            reaction = "sparkling clean"
-            note = "Took a refreshing bath."
+        effects = self._ACTION_EFFECTS.get(action)
+        if effects is not None:
+            hunger_delta, hygiene_delta, energy_delta, health_delta, xp_gain, reaction, note_template = effects
+            hunger = self._clamp(hunger + hunger_delta)
+            hygiene = self._clamp(hygiene + hygiene_delta)
+            energy = self._clamp(energy + energy_delta)
+            health = self._clamp(health + health_delta)
+            xp += xp_gain
+            note = note_template.format(
+                food_type=payload.food_type or "meal",
+                game_type=payload.game_type or "together",
+            )
         elif action is PetAction.rest:
             duration = payload.duration_hours or 1
             energy = self._clamp(energy + 10 * duration)
@@ -615,6 +642,7 @@ class PetService:
         return updated_pet, reaction, diary_payload
 
     async def _persist_pet_state(self, user_id: str, pet: Pet, action: Optional[PetAction] = None) -> None:
+        self._invalidate_pet(user_id)
         pool = await self._require_pool()
         columns = self._column_map
         assert columns is not None
@@ -631,40 +659,17 @@ class PetService:
             updates[columns["color"]] = pet.color
 
         set_parts = [f"{col} = ${idx}" for idx, col in enumerate(updates.keys(), start=2)]
-        
-        # Update action timestamps if columns exist
-        timestamp_updates = []
-        async with pool.acquire() as connection:
-            await self._ensure_infrastructure(connection)
-            
-            # Check which timestamp columns exist
-            timestamp_cols = await connection.fetch(
-                """
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_schema = 'public' AND table_name = 'pets'
-                AND column_name IN ('last_fed', 'last_played', 'last_bathed', 'last_slept')
-                """
-            )
-            available_timestamp_cols = {row['column_name'] for row in timestamp_cols}
-            
-            if action:
-                if action is PetAction.feed and 'last_fed' in available_timestamp_cols:
-                    timestamp_updates.append("last_fed = NOW()")
-                elif action is PetAction.play and 'last_played' in available_timestamp_cols:
-                    timestamp_updates.append("last_played = NOW()")
-                elif action is PetAction.bathe and 'last_bathed' in available_timestamp_cols:
-                    timestamp_updates.append("last_bathed = NOW()")
-                elif action is PetAction.rest and 'last_slept' in available_timestamp_cols:
-                    timestamp_updates.append("last_slept = NOW()")
-        
-        all_updates = set_parts + timestamp_updates
+        timestamp_col = self._ACTION_TIMESTAMP_COLUMNS.get(action) if action else None
+
         async with pool.acquire() as connection:
             await self._ensure_infrastructure(connection)
+            # Stamp the action's timestamp column if the table has it
+            if timestamp_col in self._timestamp_columns:
+                set_parts.append(f"{timestamp_col} = NOW()")
             await connection.execute(
                 f"""
                 UPDATE pets
-                SET {', '.join(all_updates)}, updated_at = NOW()
+                SET {', '.join(set_parts)}, updated_at = NOW()
                 WHERE user_id = $1
                 """,
                 user_id,
@@ -707,13 +712,7 @@ class PetService:
         new_stage = self._determine_stage(new_level)
         
         if old_stage != new_stage:
-            stage_names = {
-                EvolutionStage.egg: "Egg",
-                EvolutionStage.juvenile: "Juvenile",
-                EvolutionStage.adult: "Adult",
-                EvolutionStage.legendary: "Legendary"
-            }
-            return f"{pet.name} has evolved to {stage_names[new_stage]} stage! 🎉"
+            return self._EVOLUTION_MESSAGES[new_stage].format(name=pet.name)
         return None
 
     def _calculate_base_mood(self, hunger: int, hygiene: int, energy: int, health: int) -> str:
@@ -784,8 +783,8 @@ class PetService:
             },
             "action": action.value,
             "request": request.model_dump(exclude_none=True),
-            "before": stats_before.__dict__,
-            "after": stats_after.__dict__,
+            "before": asdict(stats_before),
+            "after": asdict(stats_after),
             "base_reaction": base_reaction,
         }
         try:
@@ -835,6 +834,26 @@ class PetService:
             "recommended_actions": recommendations,
         }
 
+    @staticmethod
+    def _diary_row_to_response(row) -> PetDiaryEntryResponse:
+        # asyncpg returns the UUID primary key as uuid.UUID; the schema expects a string
+        return PetDiaryEntryResponse(
+            id=str(row["id"]),
+            mood=row["mood"],
+            note=row["note"],
+            created_at=row["created_at"],
+        )
+
+    @staticmethod
+    def _decode_diary_entries(value: Optional[str]) -> list[Dict[str, Any]]:
+        # The pet query returns its recent diary as a json_agg array (NULL when empty)
+        if value is None:
+            return []
+        entries = json.loads(value)
+        for entry in entries:
+            entry["created_at"] = datetime.fromisoformat(entry["created_at"])
+        return entries
+
     def _row_to_domain(self, row, diary_rows) -> Pet:
         stats = DomainPetStats(
             hunger=row["hunger"],
@@ -874,7 +893,7 @@ class PetService:
             PetDiaryEntryResponse(id=entry.id, mood=entry.mood, note=entry.note, created_at=entry.created_at)
             for entry in pet.diary
         ]
-        stats = PetStats(**pet.stats.__dict__)
+        stats = PetStats(**asdict(pet.stats))
         return PetResponse(
             id=pet.id,
             user_id=pet.user_id,
@@ -890,33 +909,14 @@ class PetService:
         )
 
     def _response_to_domain(self, response: PetResponse) -> Pet:
-        stats = DomainPetStats(
-            hunger=response.stats.hunger,
-            hygiene=response.stats.hygiene,
-            energy=response.stats.energy,
-            mood=response.stats.mood,
-            health=response.stats.health,
-            xp=response.stats.xp,
-            level=response.stats.level,
-            evolution_stage=response.stats.evolution_stage.value
-            if isinstance(response.stats.evolution_stage, EvolutionStage)
-            else response.stats.evolution_stage,
-            is_sick=response.stats.is_sick,
-        )
-        diary = [
-            PetDiaryEntry(id=entry.id, mood=entry.mood, note=entry.note, created_at=entry.created_at)
-            for entry in response.diary
-        ]
+        # model_dump copies fields out in pydantic-core; nested models are rebuilt as dataclasses
+        stats_data = response.stats.model_dump()
+        if isinstance(response.stats.evolution_stage, EvolutionStage):
+            stats_data["evolution_stage"] = response.stats.evolution_stage.value
+        diary = [PetDiaryEntry(**entry.model_dump()) for entry in response.diary]
         return Pet(
-            id=response.id,
-            user_id=response.user_id,
-            name=response.name,
-            species=response.species,
-            breed=response.breed,
-            color=response.color,
-            created_at=response.created_at,
-            updated_at=response.updated_at,
-            stats=stats,
+            **response.model_dump(exclude={"stats", "diary", "seasonal_state"}),
+            stats=DomainPetStats(**stats_data),
             diary=diary,
         )
 
@@ -181,7 +181,7 @@ class QuestService:
                 )
 
                 if not quest_row:
-                    logger.warning(f"Quest with key '{quest_key}' not found")
+                    logger.warning("Quest with key '%s' not found", quest_key)
                     return None
 
                 quest_id = quest_row["id"]
@@ -372,16 +372,18 @@ class QuestService:
                     )
                     if xp_result == "UPDATE 0":
                         # public_profiles doesn't exist, check if profiles has total_xp
-                        xp_row = await conn.fetchrow(
+                        has_total_xp = await conn.fetchval(
                             """
-                            SELECT column_name
-                            FROM information_schema.columns
-                            WHERE table_schema = 'public' 
-                            AND table_name = 'profiles'
-                            AND column_name = 'total_xp'
+                            SELECT EXISTS (
+                                SELECT 1
+                                FROM information_schema.columns
+                                WHERE table_schema = 'public'
+                                AND table_name = 'profiles'
+                                AND column_name = 'total_xp'
+                            )
                             """
                         )
-                        if xp_row:
+                        if has_total_xp:
                             total_xp_row = await conn.fetchrow(
                                 """
                                 UPDATE profiles
@@ -1,6 +1,7 @@
 """Combine seasonal events and weather into pet mood adjustments."""
 from __future__ import annotations
 
+import asyncio
 from dataclasses import replace
 from datetime import date
 from typing import Dict, List, Optional, Tuple
@@ -26,6 +27,13 @@ class SeasonalReactionsService:
         "Mist": ("curious", {"hygiene": -2}, {"weather": "mist"}),
         "Fog": ("calm", {"energy": -2}, {"weather": "fog"}),
     }
+    # (minimum stat average, mood) checked in order; anything lower is "distressed"
+    _AVERAGE_MOOD_THRESHOLDS: Tuple[Tuple[int, str], ...] = (
+        (90, "ecstatic"),
+        (75, "happy"),
+        (55, "content"),
+        (35, "anxious"),
+    )
 
     def __init__(self, event_service: EventService, weather_service: WeatherService) -> None:
         self._event_service = event_service
@@ -40,8 +48,16 @@ class SeasonalReactionsService:
         lon: Optional[float] = None,
     ) -> Tuple[DomainPetStats, SeasonalMoodPayload]:
         """Collect events and weather, returning adjusted stats and payload."""
-        current_events, _ = await self._event_service.list_events(today=date.today())
+        # Events come from the database and weather from an HTTP API; neither depends on the other
+        (current_events, _), weather_snapshot = await asyncio.gather(
+            self._event_service.list_events(today=date.today()),
+            self._weather_service.get_weather(user_id=user_id, lat=lat, lon=lon),
+        )
         participation = await self._event_service.get_participation_map(user_id, (event.event_id for event in current_events))
+        # Each upsert touches its own (event, user) row, so they can run side by side
+        await asyncio.gather(
+            *(self._event_service.ensure_participation(user_id, event) for event in current_events)
+        )
         overlays: Dict[str, str] = {}
         stat_modifiers: Dict[str, int] = {}
         active_event_ids: List[str] = []
@@ -52,7 +68,6 @@ class SeasonalReactionsService:
 
         for event in current_events:
             active_event_ids.append(event.event_id)
-            await self._event_service.ensure_participation(user_id, event)
             self._apply_effect(event.effects, stats, stat_modifiers, overlays)
             if event.effects.mood:
                 event_mood = event_mood or event.effects.mood
@@ -60,7 +75,6 @@ class SeasonalReactionsService:
             if participation_record and participation_record.status == "completed":
                 participation_override = participation_override or "proud"
 
-        weather_snapshot = await self._weather_service.get_weather(user_id=user_id, lat=lat, lon=lon)
         weather_mood, weather_modifiers, weather_overlay = self._derive_weather_effect(weather_snapshot)
         self._apply_stat_changes(stats, weather_modifiers)
         self._merge_modifiers(stat_modifiers, weather_modifiers)
@@ -131,15 +145,10 @@ class SeasonalReactionsService:
         if weather_mood:
             return weather_mood
         average = (stats.hunger + stats.hygiene + stats.energy + stats.health) / 4
-        if average >= 90:
-            return "ecstatic"
-        if average >= 75:
-            return "happy"
-        if average >= 55:
-            return "content"
-        if average >= 35:
-            return "anxious"
-        return "distressed"
+        return next(
+            (mood for threshold, mood in self._AVERAGE_MOOD_THRESHOLDS if average >= threshold),
+            "distressed",
+        )
 
     def _clamp(self, value: int, minimum: int = 0, maximum: int = 100) -> int:
         return max(minimum, min(maximum, value))
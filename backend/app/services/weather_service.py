@@ -14,9 +14,20 @@ class WeatherService:
     """Fetch weather from OpenWeatherMap with graceful fallbacks."""
 
     _CACHE_TTL = timedelta(minutes=15)
+    # ~1 km precision: nearby users share one cached observation
+    _CACHE_COORD_PRECISION = 2
+    _CACHE_MAX_ENTRIES = 1024
+    # (condition, description, icon, temperature, humidity, wind speed) keyed by fallback reason
+    _FALLBACK_PRESETS: dict[str, tuple[str, str, str, float, float, float]] = {
+        "missing_configuration": ("Clear", "Pleasant clear skies.", "01d", 22.0, 50.0, 2.5),
+        "network_error": ("Clouds", "Soft clouds drifting by.", "02d", 18.0, 60.0, 4.0),
+    }
+    _DEFAULT_FALLBACK_PRESET = ("Clear", "Bright and calm day.", "01d", 20.0, 55.0, 3.0)
 
     def __init__(self, *, client: Optional[httpx.AsyncClient] = None) -> None:
         self._client = client
+        # Only clients created here are closed by ``aclose``; injected ones belong to the caller
+        self._owns_client = client is None
         self._api_key = get_settings().weather_api_key
         self._cache: dict[str, WeatherSnapshot] = {}
 
@@ -28,22 +39,23 @@ class WeatherService:
         lon: Optional[float],
     ) -> WeatherSnapshot:
         """Return the latest weather snapshot, using cache and fallbacks."""
-        cache_key = self._cache_key(user_id, lat, lon)
+        now = datetime.now(timezone.utc)
+        cache_key = self._cache_key(lat, lon)
         cached = self._cache.get(cache_key)
-        if cached and datetime.now(timezone.utc) - cached.fetched_at <= self._CACHE_TTL:
+        if cached and now - cached.fetched_at <= self._CACHE_TTL:
             return cached
 
         if not self._api_key or lat is None or lon is None:
-            snapshot = self._fallback_snapshot(reason="missing_configuration")
-            self._cache[cache_key] = snapshot
+            snapshot = self._fallback_snapshot(reason="missing_configuration", now=now)
+            self._store(cache_key, snapshot)
             return snapshot
 
         try:
             snapshot = await self._fetch_weather(lat=lat, lon=lon)
         except Exception:
-            snapshot = self._fallback_snapshot(reason="network_error")
+            snapshot = self._fallback_snapshot(reason="network_error", now=now)
 
-        self._cache[cache_key] = snapshot
+        self._store(cache_key, snapshot)
         return snapshot
 
     async def _fetch_weather(self, *, lat: float, lon: float) -> WeatherSnapshot:
@@ -55,10 +67,9 @@ class WeatherService:
             "units": "metric",
         }
 
-        async with (self._client or httpx.AsyncClient(timeout=10.0)) as client:
-            response = await client.get(url, params=params)  # type: ignore[arg-type]
-            response.raise_for_status()
-            payload = response.json()
+        response = await self._get_client().get(url, params=params)  # type: ignore[arg-type]
+        response.raise_for_status()
+        payload = response.json()
 
         weather_data = payload["weather"][0]
         main_data = payload["main"]
@@ -76,14 +87,26 @@ class WeatherService:
             provider="openweathermap",
         )
 
-    def _fallback_snapshot(self, *, reason: str) -> WeatherSnapshot:
-        presets = {
-            "missing_configuration": ("Clear", "Pleasant clear skies.", "01d", 22.0, 50.0, 2.5),
-            "network_error": ("Clouds", "Soft clouds drifting by.", "02d", 18.0, 60.0, 4.0),
-        }
-        condition, description, icon, temp, humidity, wind = presets.get(
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        The service is a process-wide singleton, so one pooled client keeps
+        connections to the weather API alive across requests.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=10.0)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this service created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _fallback_snapshot(self, *, reason: str, now: datetime) -> WeatherSnapshot:
+        condition, description, icon, temp, humidity, wind = self._FALLBACK_PRESETS.get(
             reason,
-            ("Clear", "Bright and calm day.", "01d", 20.0, 55.0, 3.0),
+            self._DEFAULT_FALLBACK_PRESET,
         )
         return WeatherSnapshot(
             condition=condition,
@@ -93,14 +116,23 @@ class WeatherService:
             humidity=humidity,
             wind_speed=wind,
             is_fallback=True,
-            fetched_at=datetime.now(timezone.utc),
+            fetched_at=now,
             provider="fallback",
         )
 
-    def _cache_key(self, user_id: Optional[str], lat: Optional[float], lon: Optional[float]) -> str:
-        if user_id:
-            return f"{user_id}:{lat}:{lon}"
-        return f"anon:{lat}:{lon}"
+    def _cache_key(self, lat: Optional[float], lon: Optional[float]) -> str:
+        # Weather depends only on location, so the key is shared across users
+        if lat is None or lon is None:
+            return "unknown"
+        precision = self._CACHE_COORD_PRECISION
+        return f"{round(lat, precision)}:{round(lon, precision)}"
+
+    def _store(self, cache_key: str, snapshot: WeatherSnapshot) -> None:
+        # Re-insert so dict order tracks recency, then evict the oldest entry when full
+        self._cache.pop(cache_key, None)
+        if len(self._cache) >= self._CACHE_MAX_ENTRIES:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[cache_key] = snapshot
 
 
 __all__ = ["WeatherService"]
@@ -19,5 +19,6 @@ def configure_logging(level: int = logging.INFO) -> None:
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
-    configure_logging()
+    # Handler setup is deferred to ``configure_logging`` (called from ``create_app``)
+    # so importing a module never installs root handlers as a side effect.
     return logging.getLogger(name or __name__)
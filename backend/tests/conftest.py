@@ -9,6 +9,7 @@ from httpx import AsyncClient
 
 from app.core.config import get_settings
 from app.main import app
+from app.services.pet_ai_service import PetAIService
 
 
 @pytest.fixture(autouse=True)
@@ -22,6 +23,14 @@ def configure_test_environment(monkeypatch: pytest.MonkeyPatch):
     get_settings.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def reset_ai_circuit_breaker():
+    # The breaker is process-wide, so a tripped breaker would leak into later tests
+    PetAIService._reset_breaker()
+    yield
+    PetAIService._reset_breaker()
+
+
 @pytest.fixture(scope="session")
 def event_loop() -> AsyncIterator[asyncio.AbstractEventLoop]:
     loop = asyncio.new_event_loop()
@@ -147,3 +147,11 @@ async def test_weather_endpoint(test_client: AsyncClient, override_event_depende
     assert data["temperature_c"] == -4.0
     assert data["provider"] == "test-weather"
 
+
+
+@pytest.mark.anyio
+async def test_weather_endpoint_rejects_out_of_range_coordinates(
+    test_client: AsyncClient, override_event_dependencies
+) -> None:
+    response = await test_client.get("/api/weather?lat=91&lon=-0.1")
+    assert response.status_code == 422
@@ -70,3 +70,23 @@ async def test_predict_habits_fallback():
         
         assert "predicted_habits" in predictions
         assert len(predictions["predicted_habits"]) > 0
+
+
+def test_prepare_habit_data_buckets_and_consistency():
+    """Test time-of-day buckets and consistency from a single parse pass."""
+    service = HabitPredictionService()
+
+    habit_data = service._prepare_habit_data(
+        [
+            {"action": "feed", "timestamp": "2024-01-01T05:00:00Z"},
+            {"action": "feed", "timestamp": "2024-01-01T21:00:00Z"},
+            {"action": "play", "timestamp": "not-a-timestamp"},
+            {"action": "play", "timestamp": "2024-01-02T05:00:00Z"},
+        ],
+        [],
+    )
+
+    assert habit_data["daily_patterns"]["Monday"]["time_periods"] == {"night": 1, "evening": 1}
+    assert habit_data["daily_patterns"]["Tuesday"]["time_periods"] == {"night": 1}
+    assert habit_data["care_consistency"] == 1.0
+    assert habit_data["total_interactions"] == 4
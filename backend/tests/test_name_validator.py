@@ -0,0 +1,126 @@
+"""
+Unit tests for the name validator AI
+"""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.ai.name_validator import NameValidatorAI
+
+
+def test_fallback_suggestions_are_unique_and_capped():
+    """Fallback suggestions never repeat and stop at five"""
+    validator = NameValidatorAI()
+
+    suggestions = validator._generate_fallback_suggestions("Max", "canine")
+
+    assert suggestions == ["Maxy", "Maxie", "Maxo", "Maxer", "Little max"]
+    assert len(set(suggestions)) == len(suggestions)
+
+
+def test_fallback_suggestions_skip_input_name():
+    """Species suggestions exclude the name the user already typed"""
+    validator = NameValidatorAI()
+
+    suggestions = validator._generate_fallback_suggestions("", "dragon")
+
+    assert suggestions == ["Spike", "Flame", "Aurelius", "Draco", "Saphira"]
+
+
+def test_validate_name_uniqueness_is_case_insensitive():
+    """Uniqueness check ignores case of existing names"""
+    validator = NameValidatorAI()
+
+    result = validator._validate_name("Fluffy", ["buddy", "FLUFFY"])
+
+    assert result["valid"] is False
+    assert result["details"]["unique"] is False
+
+
+@pytest.mark.asyncio
+async def test_concurrent_suggestion_requests_are_coalesced():
+    """Concurrent identical requests share a single AI call"""
+    validator = NameValidatorAI()
+    calls = []
+
+    async def fake_generate(input_name, is_valid, pet_species=None):
+        calls.append(input_name)
+        await asyncio.sleep(0)
+        return [f"{input_name}ling"]
+
+    with patch.object(validator, "_generate_ai_suggestions", side_effect=fake_generate):
+        results = await asyncio.gather(
+            validator.validate_and_suggest("Spark", pet_species="dragon"),
+            validator.validate_and_suggest("Spark", pet_species="dragon"),
+            validator.validate_and_suggest("spark", pet_species="dragon"),
+        )
+
+    # Differently-cased names get their own prompt, so each caller sees suggestions for its input
+    assert calls == ["Spark", "spark"]
+    assert [result["suggestions"] for result in results] == [["Sparkling"], ["Sparkling"], ["sparkling"]]
+    assert validator._inflight_suggestions == {}
+
+
+def test_format_check_matches_pattern_for_ascii_and_unicode():
+    """ASCII fast path agrees with VALID_CHAR_PATTERN"""
+    for name in ("Max", "Mr Fluffy", "O'Malley", "Jean-Luc", "R2D2"):
+        assert NameValidatorAI._has_valid_format(name) is True
+    for name in ("", "-Max", "Max-", "Max!", "Zoë", " Max"):
+        assert NameValidatorAI._has_valid_format(name) is False
+
+
+def test_profanity_is_detected_inside_names():
+    """Profanity words are caught as substrings regardless of case"""
+    validator = NameValidatorAI()
+
+    result = validator._validate_name("MyBadWord1Pet")
+
+    assert result["valid"] is False
+    assert result["details"]["profanity"] is True
+
+
+def test_cached_rule_results_are_not_shared_mutably():
+    """Mutating one validation result does not leak into the next"""
+    validator = NameValidatorAI()
+
+    first = validator._validate_name("Bad Name!")
+    first["errors"].append("mutated")
+    first["details"]["format_valid"] = True
+    second = validator._validate_name("Bad Name!")
+
+    assert "mutated" not in second["errors"]
+    assert second["details"]["format_valid"] is False
+
+
+@pytest.mark.asyncio
+async def test_ai_suggestions_are_cleaned_and_deduplicated():
+    """AI response lines lose list markers and case-insensitive duplicates"""
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json.return_value = {
+        "choices": [{"message": {"content": '1. Nova\n2. "nova"\n- Ember\n* Bad!\nAsh\nPip\nZed\nMoss'}}]
+    }
+    client = MagicMock()
+    client.post = AsyncMock(return_value=response)
+    settings = MagicMock(openrouter_api_key="key", openrouter_base_url="https://example.test", openrouter_model="m")
+
+    validator = NameValidatorAI(client=client)
+    with patch("app.ai.name_validator.get_settings", return_value=settings):
+        suggestions = await validator._generate_ai_suggestions("Spark", True, "dragon")
+
+    assert suggestions == ["Nova", "Ember", "Ash", "Pip", "Zed"]
+
+
+def test_length_failure_stops_validation():
+    """A too-long name reports only the length error"""
+    validator = NameValidatorAI()
+
+    result = validator._validate_name("x" * 40 + "!", ["x" * 40 + "!"])
+
+    assert result["valid"] is False
+    assert result["errors"] == ["Name must be no more than 20 characters long"]
+    assert "format_valid" not in result["details"]
+    assert "unique" not in result["details"]
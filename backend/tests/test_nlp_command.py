@@ -0,0 +1,135 @@
+"""
+Unit tests for the NLP command engine's rule-based fallback
+"""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.ai.nlp_command import NLPCommandEngine
+
+
+@pytest.mark.parametrize(
+    "command, action, confidence, parameters",
+    [
+        ("feed my pet some tuna", "feed", 0.8, {"food_type": "tuna"}),
+        ("give him a treat", "feed", 0.7, {"food_type": "treat"}),
+        ("let's play fetch", "play", 0.8, {"game_type": "fetch"}),
+        ("time for a bath", "bathe", 0.7, {}),
+        ("my pet is sleepy, take a nap", "rest", 0.8, {"duration_hours": "2"}),
+        ("rest overnight", "rest", 0.8, {"duration_hours": "8"}),
+        ("how is my pet doing", "status", 0.6, {}),
+        ("check my coins balance", "status", 0.8, {}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_fallback_keyword_matching(command, action, confidence, parameters):
+    """Fallback parsing picks the action and parameters from keywords"""
+    engine = NLPCommandEngine()
+
+    result = await engine._process_with_fallback(command, "session", None)
+
+    assert result["action"] == action
+    assert result["confidence"] == pytest.approx(confidence)
+    assert result["parameters"] == parameters
+    assert result["fallback_used"] is True
+
+
+@pytest.mark.asyncio
+async def test_fallback_unknown_command_suggests_based_on_pet_state():
+    """Unrecognized commands get suggestions prioritised by pet needs"""
+    engine = NLPCommandEngine()
+
+    result = await engine._process_with_fallback(
+        "sing a song", "session", {"name": "Luna", "hunger": 20, "energy": 80}
+    )
+
+    assert result["action"] == "unknown"
+    assert result["needs_clarification"] is True
+    assert result["suggestions"][0] == "Your pet Luna might be hungry - try: 'feed my pet'"
+    assert "Try: 'bathe my pet'" in result["suggestions"]
+
+
+@pytest.mark.parametrize(
+    "command, parameters",
+    [
+        ("feed him a snack", {"food_type": "treat"}),
+        ("feed a tuna treat", {"food_type": "tuna"}),
+        ("feed my pet", {"food_type": "standard"}),
+        ("play a puzzle game", {"game_type": "puzzle"}),
+        ("play outside", {"game_type": "free_play"}),
+        ("long nap please", {"duration_hours": "8"}),
+        ("rest a bit", {"duration_hours": "4"}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_fallback_parameter_extraction(command, parameters):
+    """Parameters fall back to defaults and respect option priority"""
+    engine = NLPCommandEngine()
+
+    result = await engine._process_with_fallback(command, "session", None)
+
+    assert result["parameters"] == parameters
+
+
+@pytest.mark.asyncio
+async def test_ai_prompt_includes_pet_context():
+    """The user message carries the formatted pet context block"""
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json.return_value = {"choices": [{"message": {"content": '{"action": "feed", "confidence": 0.9}'}}]}
+    client = MagicMock()
+    client.post = AsyncMock(return_value=response)
+    settings = MagicMock(openrouter_api_key="key", openrouter_base_url="https://openrouter.test", openrouter_model="m")
+
+    engine = NLPCommandEngine(client=client)
+    engine._conversation_context["session"] = []
+    await engine._process_with_ai(
+        "feed her",
+        "session",
+        {"name": "Luna", "hunger": 40, "happiness": 90, "energy": 20, "cleanliness": 75},
+        settings,
+    )
+
+    user_message = client.post.call_args.kwargs["json"]["messages"][-1]["content"]
+    assert user_message == (
+        "\nPet Context:\n"
+        "- Name: Luna\n"
+        "- Hunger: 40/100 (low)\n"
+        "- Happiness: 90/100\n"
+        "- Energy: 20/100 (very low - may need rest)\n"
+        "- Cleanliness: 75/100\n"
+        "\nUser command: feed her"
+    )
+
+
+@pytest.mark.asyncio
+async def test_fallback_keyword_matches_are_cached_per_command():
+    """Repeated commands reuse the cached match without sharing mutable results"""
+    engine = NLPCommandEngine()
+    NLPCommandEngine._match_keywords.cache_clear()
+
+    first = await engine._process_with_fallback("Feed my pet some tuna", "session", None)
+    first["parameters"]["food_type"] = "mutated"
+    second = await engine._process_with_fallback("feed my pet some tuna ", "session", None)
+
+    assert NLPCommandEngine._match_keywords.cache_info().hits == 1
+    assert second["parameters"] == {"food_type": "tuna"}
+
+
+@pytest.mark.asyncio
+async def test_fallback_suggestions_put_tired_before_hungry():
+    """Pet-need hints lead the shared default suggestions, which stay unmodified"""
+    engine = NLPCommandEngine()
+
+    result = await engine._process_with_fallback(
+        "sing a song", "session", {"name": "Luna", "hunger": 20, "energy": 10}
+    )
+    result["suggestions"].append("mutated")
+
+    assert result["suggestions"][:2] == [
+        "Your pet might be tired - try: 'rest'",
+        "Your pet Luna might be hungry - try: 'feed my pet'",
+    ]
+    assert "mutated" not in NLPCommandEngine.UNKNOWN_COMMAND_SUGGESTIONS
@@ -0,0 +1,43 @@
+"""
+Unit tests for the NLP command service's rule-based fallback
+"""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.nlp_command_service import NLPCommandService
+
+
+@pytest.mark.parametrize(
+    "command, action",
+    [
+        ("feed my pet", "feed"),
+        ("let's play fetch", "play"),
+        ("time to wash up", "bathe"),
+        ("show my coins", "budget"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_fallback_picks_action_from_keywords(command, action):
+    """Fallback parsing picks the action from its keywords"""
+    service = NLPCommandService(client=MagicMock())
+
+    result = await service._process_with_fallback(command, "session", None)
+
+    assert result["action"] == action
+    assert 0.0 < result["confidence"] <= 0.9
+    assert result["fallback_used"] is True
+
+
+@pytest.mark.asyncio
+async def test_fallback_unknown_command_needs_clarification():
+    """Commands without keywords ask for clarification"""
+    service = NLPCommandService(client=MagicMock())
+
+    result = await service._process_with_fallback("sing a song", "session", None)
+
+    assert result["action"] == "unknown"
+    assert result["needs_clarification"] is True
+    assert result["suggestions"] == list(NLPCommandService.UNKNOWN_COMMAND_SUGGESTIONS)
@@ -3,7 +3,9 @@ Unit tests for Pet AI service
 """
 from __future__ import annotations
 
+import httpx
 import pytest
+from fastapi import HTTPException
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from app.services.pet_ai_service import PetAIService, ReactionResult
@@ -229,3 +231,37 @@ async def test_retry_logic():
 
         assert result.reaction == "Test reaction"
         assert mock_post.call_count >= 2
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_after_repeated_failures():
+    """Test repeated gateway failures stop further calls until cooldown"""
+    client = MagicMock()
+    client.post = AsyncMock(side_effect=httpx.ConnectError("down"))
+    service = PetAIService(pool=None, client=client)
+    settings = MagicMock(openrouter_base_url="https://openrouter.test")
+
+    PetAIService._breaker_failures = PetAIService._BREAKER_FAILURE_THRESHOLD - 1
+    with patch("app.services.pet_ai_service.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        with pytest.raises(HTTPException):
+            await service._post_with_retry(settings, {}, {})
+        assert client.post.call_count == service._max_retries
+        assert mock_sleep.await_count == service._max_retries - 1
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service._post_with_retry(settings, {}, {})
+        assert exc_info.value.status_code == 503
+        assert client.post.call_count == service._max_retries
+
+
+def test_fallback_reaction_uses_action_or_default():
+    """Fallback reactions come from the canned table, with a generic default"""
+    service = PetAIService(pool=None)
+
+    bathe = service._fallback_reaction({"action": "bathe", "after": {"mood": "happy"}})
+    other = service._fallback_reaction({"action": "dance"})
+
+    assert bathe.reaction == "shakes off the bubbles, looking refreshed!"
+    assert bathe.mood == "happy"
+    assert other.reaction == "seems appreciative of your care!"
+    assert other.health_forecast is None
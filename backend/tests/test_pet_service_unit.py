@@ -1,6 +1,7 @@
 """Comprehensive unit tests for PetService to increase coverage."""
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -18,6 +19,7 @@ from app.schemas import (
     PetResponse,
     PetStats,
     PetUpdate,
+    SeasonalMoodPayload,
 )
 from app.services.pet_service import PetService
 from app.services.pet_ai_service import PetAIService, ReactionResult
@@ -347,3 +349,353 @@ async def test_service_no_pool_error(mock_ai_service, mock_seasonal_service):
         await service.get_pet("user-1")
     
     assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+PET_COLUMNS = [
+    {'column_name': name}
+    for name in (
+        'id', 'user_id', 'name', 'species', 'breed', 'hunger', 'hygiene',
+        'energy', 'mood', 'health', 'xp', 'level',
+    )
+]
+
+
+def _pet_row(user_id: str, pet_id: str) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        'id': pet_id,
+        'user_id': user_id,
+        'name': 'TestPet',
+        'species': 'dragon',
+        'breed': 'Azure',
+        'color': None,
+        'created_at': now,
+        'updated_at': now,
+        'hunger': 70,
+        'hygiene': 80,
+        'energy': 60,
+        'mood_value': 80,
+        'health': 90,
+        'xp': 10,
+        'level': 2,
+        'diary_entries': None,
+    }
+
+
+@pytest.mark.anyio
+async def test_get_pet_is_memoized_until_a_write(mock_pool):
+    """Repeated get_pet calls within one service reuse the first fetch."""
+    pool, connection = mock_pool
+    user_id = str(uuid4())
+    pet_id = str(uuid4())
+    connection.fetch.side_effect = lambda query, *args: (
+        PET_COLUMNS if 'information_schema' in query else []
+    )
+    connection.fetchrow.return_value = _pet_row(user_id, pet_id)
+
+    service = PetService(pool)
+    first = await service.get_pet(user_id)
+    first.stats.hunger = 1  # caller mutation must not leak into the memo
+    second = await service.get_pet(user_id)
+
+    assert pool.acquire.call_count == 1
+    assert second.stats.hunger == 70
+
+    connection.fetchrow.return_value = {
+        'id': str(uuid4()), 'mood': 'happy', 'note': None, 'created_at': datetime.now(timezone.utc),
+    }
+    await service.add_diary_entry(user_id, pet_id, PetDiaryCreate(mood="happy"))
+    connection.fetchrow.return_value = _pet_row(user_id, pet_id)
+    await service.get_pet(user_id)
+
+    assert pool.acquire.call_count == 3
+
+
+def test_response_to_domain_round_trips():
+    """Converting a response back to the domain model preserves every field."""
+    now = datetime.now(timezone.utc)
+    pet = Pet(
+        id=str(uuid4()),
+        user_id=str(uuid4()),
+        name='TestPet',
+        species='dragon',
+        breed='Azure',
+        color='blue',
+        created_at=now,
+        updated_at=now,
+        stats=DomainPetStats(
+            hunger=70, hygiene=80, energy=60, mood='happy', health=90,
+            xp=10, level=5, evolution_stage='juvenile', is_sick=False,
+        ),
+        diary=[PetDiaryEntry(id=str(uuid4()), mood='happy', note='Fed', created_at=now)],
+    )
+    service = PetService(None)
+
+    assert service._response_to_domain(service._domain_to_response(pet)) == pet
+
+
+@pytest.mark.anyio
+async def test_apply_action_builds_response_without_refetch(mock_pool):
+    """The action response comes from the persisted state, not a second pet read."""
+    pool, connection = mock_pool
+    user_id = str(uuid4())
+    pet_id = str(uuid4())
+    entry_id = str(uuid4())
+    connection.fetch.side_effect = lambda query, *args: (
+        PET_COLUMNS if 'information_schema' in query else []
+    )
+    connection.fetchrow.side_effect = [
+        _pet_row(user_id, pet_id),
+        {'id': entry_id, 'mood': 'happy', 'note': 'Yum', 'created_at': datetime.now(timezone.utc)},
+    ]
+
+    service = PetService(pool)
+    result = await service.apply_action(user_id, PetAction.feed, PetActionRequest(food_type="standard"))
+
+    assert connection.fetchrow.call_count == 2
+    assert result.pet.id == pet_id
+    assert result.pet.stats.mood == result.mood
+    assert [entry.id for entry in result.pet.diary] == [entry_id]
+
+
+@pytest.mark.anyio
+async def test_apply_action_response_matches_a_fresh_get_pet(mock_pool, mock_seasonal_service):
+    """Seasonal modifiers are re-applied to the persisted stats, as an immediate get_pet would."""
+    pool, connection = mock_pool
+    user_id = str(uuid4())
+    connection.fetch.side_effect = lambda query, *args: (
+        PET_COLUMNS if 'information_schema' in query else []
+    )
+    connection.fetchrow.side_effect = [
+        _pet_row(user_id, str(uuid4())),
+        {'id': uuid4(), 'mood': 'happy', 'note': 'Yum', 'created_at': datetime.now(timezone.utc)},
+    ]
+
+    async def gather_mood_context(*, user_id, pet):
+        payload = SeasonalMoodPayload(
+            mood=None, stat_modifiers={'energy': 10}, overlays={}, active_events=['spring'], weather_condition=None,
+        )
+        return replace(pet.stats, energy=min(100, pet.stats.energy + 10)), payload
+
+    mock_seasonal_service.gather_mood_context = AsyncMock(side_effect=gather_mood_context)
+    service = PetService(pool, seasonal_service=mock_seasonal_service)
+    result = await service.apply_action(user_id, PetAction.feed, PetActionRequest(food_type="standard"))
+
+    # get_pet shows 60 + 10 energy; feeding persists 75, which a fresh read shows as 85
+    assert result.pet.stats.energy == 85
+    assert result.pet.seasonal_state.mood == result.mood
+    assert mock_seasonal_service.gather_mood_context.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_persist_stamps_action_timestamp_column(mock_pool):
+    """Persisting an action stamps that action's timestamp column when it exists."""
+    pool, connection = mock_pool
+    connection.fetch.side_effect = lambda query, *args: PET_COLUMNS + [{'column_name': 'last_played'}]
+    service = PetService(pool)
+    await service._detect_columns(connection)
+    connection.fetch.reset_mock()
+    row = _pet_row(str(uuid4()), str(uuid4()))
+    pet = service._row_to_domain(row, [])
+
+    await service._persist_pet_state(row['user_id'], pet, PetAction.play)
+    await service._persist_pet_state(row['user_id'], pet, PetAction.feed)
+
+    connection.fetch.assert_not_awaited()
+    update_sql = connection.execute.await_args_list[-2].args[0]
+    assert "last_played = NOW()" in update_sql
+    assert "last_fed" not in connection.execute.await_args.args[0]
+
+
+@pytest.mark.anyio
+async def test_get_diary_reads_only_diary_rows(mock_pool, mock_seasonal_service):
+    """Listing the diary skips the full pet load and seasonal lookup."""
+    pool, connection = mock_pool
+    entry_id = uuid4()
+    connection.fetch.side_effect = lambda query, *args: (
+        PET_COLUMNS if 'information_schema' in query
+        else [{'id': entry_id, 'mood': 'happy', 'note': 'Fed', 'created_at': datetime.now(timezone.utc)}]
+    )
+    connection.fetchval.return_value = str(uuid4())
+
+    service = PetService(pool, seasonal_service=mock_seasonal_service)
+    result = await service.get_diary(str(uuid4()))
+
+    assert [entry.id for entry in result] == [str(entry_id)]
+    connection.fetchrow.assert_not_awaited()
+    mock_seasonal_service.gather_mood_context.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_get_diary_missing_pet_raises_not_found(mock_pool):
+    """Listing the diary for a user without a pet is a 404."""
+    pool, connection = mock_pool
+    connection.fetch.side_effect = lambda query, *args: PET_COLUMNS
+    connection.fetchval.return_value = None
+
+    service = PetService(pool)
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_diary(str(uuid4()))
+
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_check_evolution_message_only_on_stage_change():
+    """Crossing a stage threshold names the new stage; staying put returns None."""
+    now = datetime.now(timezone.utc)
+    pet = Pet(
+        id=str(uuid4()), user_id=str(uuid4()), name='{Sparky}', species='dragon', breed=None,
+        color=None, created_at=now, updated_at=now,
+        stats=DomainPetStats(
+            hunger=70, hygiene=80, energy=60, mood='happy', health=90,
+            xp=0, level=6, evolution_stage='juvenile', is_sick=False,
+        ),
+    )
+    service = PetService(None)
+
+    assert service._check_evolution(pet, 6, 7) == "{Sparky} has evolved to Adult stage! 🎉"
+    assert service._check_evolution(pet, 7, 8) is None
+
+
+@pytest.mark.parametrize(
+    "action, request_payload, expected_stats, note",
+    [
+        (PetAction.feed, PetActionRequest(food_type="tuna"), (95, 75, 65, 95, 25), "Enjoyed a tuna."),
+        (PetAction.play, PetActionRequest(), (60, 70, 45, 93, 30), "Played together."),
+        (PetAction.bathe, PetActionRequest(), (70, 100, 55, 94, 20), "Took a refreshing bath."),
+    ],
+)
+def test_apply_action_effects(action, request_payload, expected_stats, note):
+    """Each fixed-effect action applies its stat deltas, XP and diary note."""
+    service = PetService(None)
+    pet = service._row_to_domain(_pet_row(str(uuid4()), str(uuid4())), [])
+
+    updated, reaction, diary = service._apply_action(pet, action, request_payload)
+    stats = updated.stats
+
+    assert (stats.hunger, stats.hygiene, stats.energy, stats.health, stats.xp) == expected_stats
+    assert reaction
+    assert diary.note == note
+
+
+@pytest.mark.anyio
+async def test_shop_item_effects_return_persisted_state_without_refetch(mock_pool):
+    """Shop items are applied, persisted and returned from a single pet read."""
+    pool, connection = mock_pool
+    user_id = str(uuid4())
+    connection.fetch.side_effect = lambda query, *args: (
+        PET_COLUMNS if 'information_schema' in query else []
+    )
+    connection.fetchrow.return_value = _pet_row(user_id, str(uuid4()))
+
+    service = PetService(pool)
+    result = await service.apply_shop_item_effects(user_id, 'food', quantity=2)
+
+    assert connection.fetchrow.await_count == 1
+    assert result.stats.hunger == 100
+    assert result.stats.xp == 20
+
+
+@pytest.mark.anyio
+async def test_shop_item_effects_reapply_seasonal_modifiers(mock_pool, mock_seasonal_service):
+    """The shop response shows the persisted stats with seasonal modifiers, like get_pet."""
+    pool, connection = mock_pool
+    user_id = str(uuid4())
+    connection.fetch.side_effect = lambda query, *args: (
+        PET_COLUMNS if 'information_schema' in query else []
+    )
+    connection.fetchrow.return_value = _pet_row(user_id, str(uuid4()))
+
+    async def gather_mood_context(*, user_id, pet):
+        payload = SeasonalMoodPayload(
+            mood=None, stat_modifiers={'energy': 10}, overlays={}, active_events=[], weather_condition='rain',
+        )
+        return replace(pet.stats, energy=min(100, pet.stats.energy + 10)), payload
+
+    mock_seasonal_service.gather_mood_context = AsyncMock(side_effect=gather_mood_context)
+    service = PetService(pool, seasonal_service=mock_seasonal_service)
+    result = await service.apply_shop_item_effects(user_id, 'medicine', quantity=1)
+
+    # get_pet shows 60 + 10 energy and medicine persists that 70, which a fresh read shows as 80
+    assert result.stats.energy == 80
+    assert result.seasonal_state.weather_condition == 'rain'
+    assert mock_seasonal_service.gather_mood_context.await_count == 2
+
+
+@pytest.mark.parametrize(
+    "category, expected",
+    [
+        ('medicine', {'health': 100, 'xp': 16}),
+        ('toy', {'energy': 80, 'hunger': 60, 'xp': 30}),
+        ('energy', {'energy': 100, 'xp': 16}),
+        ('unknown', {'hunger': 70, 'energy': 60, 'xp': 10}),
+    ],
+)
+@pytest.mark.anyio
+async def test_shop_item_effects_by_category(mock_pool, category, expected):
+    """Each shop category scales its per-unit effects by quantity."""
+    pool, connection = mock_pool
+    user_id = str(uuid4())
+    connection.fetch.side_effect = lambda query, *args: (
+        PET_COLUMNS if 'information_schema' in query else []
+    )
+    connection.fetchrow.return_value = _pet_row(user_id, str(uuid4()))
+
+    service = PetService(pool)
+    result = await service.apply_shop_item_effects(user_id, category, quantity=2)
+
+    assert {stat: getattr(result.stats, stat) for stat in expected} == expected
+
+
+@pytest.mark.anyio
+async def test_get_pet_reads_diary_from_the_pet_row(mock_pool):
+    """Recent diary entries arrive with the pet row instead of a second query."""
+    pool, connection = mock_pool
+    user_id = str(uuid4())
+    entry_id = str(uuid4())
+    connection.fetch.side_effect = lambda query, *args: (
+        PET_COLUMNS if 'information_schema' in query else pytest.fail("unexpected diary query")
+    )
+    row = _pet_row(user_id, str(uuid4()))
+    row['diary_entries'] = (
+        f'[{{"id": "{entry_id}", "mood": "happy", "note": "Fed", '
+        '"created_at": "2024-05-01T12:00:00.123456+00:00"}]'
+    )
+    connection.fetchrow.return_value = row
+
+    pet = await PetService(pool).get_pet(user_id)
+
+    assert [entry.id for entry in pet.diary] == [entry_id]
+    assert pet.diary[0].created_at == datetime(2024, 5, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+@pytest.mark.anyio
+async def test_persist_without_action_skips_timestamp_probe(mock_pool):
+    """A plain state write uses one connection and never probes timestamp columns."""
+    pool, connection = mock_pool
+    connection.fetch.side_effect = lambda query, *args: PET_COLUMNS
+    service = PetService(pool)
+    await service._detect_columns(connection)
+    connection.fetch.reset_mock()
+    row = _pet_row(str(uuid4()), str(uuid4()))
+
+    await service._persist_pet_state(row['user_id'], service._row_to_domain(row, []))
+
+    assert pool.acquire.call_count == 1
+    connection.fetch.assert_not_awaited()
+    assert "UPDATE pets" in connection.execute.await_args.args[0]
+
+
+@pytest.mark.anyio
+async def test_diary_ddl_runs_once_per_process(mock_pool, monkeypatch):
+    """The idempotent diary DDL is skipped after its first successful run."""
+    pool, connection = mock_pool
+    monkeypatch.setattr(PetService, "_infrastructure_ready", False)
+    connection.fetch.side_effect = lambda query, *args: PET_COLUMNS
+
+    await PetService(pool)._ensure_infrastructure(connection)
+    await PetService(pool)._ensure_infrastructure(connection)
+
+    ddl = [call.args[0] for call in connection.execute.await_args_list]
+    assert len(ddl) == 2
+    assert "CREATE TABLE IF NOT EXISTS pet_diary_entries" in ddl[0]
@@ -19,6 +19,7 @@ from app.schemas import (
     PetStats,
     PetUpdate,
 )
+from app.routers.pet_interactions import _derive_action_request
 from app.services.pet_service import PetService
 from app.utils.dependencies import get_current_user, get_pet_service
 
@@ -216,6 +217,19 @@ async def test_pet_interact_unknown_command_returns_error(test_client: AsyncClie
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
+@pytest.mark.anyio
+async def test_pet_interact_rejects_unknown_command_before_loading_pet(
+    test_client: AsyncClient,
+    override_pet_dependencies: FakePetService,
+) -> None:
+    override_pet_dependencies.pet_exists = False
+    response = await test_client.post(
+        "/api/pet/interact",
+        json={"action": "dance"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 def _sample_domain_pet() -> Pet:
     now = datetime.utcnow()
     stats = DomainPetStats(
@@ -262,4 +276,12 @@ def test_action_logic_marks_illness():
     pet.stats.hunger = 5
     updated_pet, _, diary_entry = service._apply_action(pet, PetAction.rest, PetActionRequest(duration_hours=1))
     assert updated_pet.stats.is_sick is True
-    assert diary_entry is not None
\ No newline at end of file
+    assert diary_entry is not None
+
+
+def test_rest_duration_uses_first_standalone_number():
+    assert _derive_action_request(PetAction.rest, "nap for 3 hours").duration_hours == 3
+    assert _derive_action_request(PetAction.rest, "sleep 2x then 40").duration_hours == 12
+    assert _derive_action_request(PetAction.rest, "rest \u0663 hours").duration_hours == 3
+    assert _derive_action_request(PetAction.rest, "rest ² hours").duration_hours == 1
+    assert _derive_action_request(PetAction.rest, None).duration_hours == 1
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import date, datetime, timedelta, timezone
 
 import pytest
@@ -147,3 +148,57 @@ async def test_weather_fallback_preserves_previous_stats_when_no_events() -> Non
     assert payload.active_events == []
     assert payload.weather_condition == "Clear"
 
+
+
+@pytest.mark.anyio
+async def test_unknown_weather_resolves_mood_from_stat_average() -> None:
+    weather_snapshot = WeatherSnapshot(
+        condition="Haze",
+        description="Hazy skies.",
+        icon="50d",
+        temperature_c=20.0,
+        humidity=50.0,
+        wind_speed=1.0,
+        is_fallback=False,
+        fetched_at=datetime.now(timezone.utc),
+        provider="test",
+    )
+    service = SeasonalReactionsService(
+        event_service=StubEventService([], {}),
+        weather_service=StubWeatherService(weather_snapshot),
+    )
+
+    pet = _pet()
+    updated_stats, payload = await service.gather_mood_context(user_id="user-1", pet=pet)
+
+    assert payload.mood == "content"  # stat average 73.75
+    assert payload.stat_modifiers == {}
+    assert updated_stats.energy == 60
+
+
+@pytest.mark.anyio
+async def test_every_active_event_gets_a_participation_row() -> None:
+    first = _event(EventEffect(mood=None, stat_modifiers={"energy": 5}, visual_overlays={}))
+    second = replace(first, event_id="event-2", name="Spring Fair")
+    weather_snapshot = WeatherSnapshot(
+        condition="Haze",
+        description="Hazy skies.",
+        icon="50d",
+        temperature_c=20.0,
+        humidity=50.0,
+        wind_speed=1.0,
+        is_fallback=False,
+        fetched_at=datetime.now(timezone.utc),
+        provider="test",
+    )
+    event_service = StubEventService([first, second], {})
+    service = SeasonalReactionsService(
+        event_service=event_service,
+        weather_service=StubWeatherService(weather_snapshot),
+    )
+
+    updated_stats, payload = await service.gather_mood_context(user_id="user-1", pet=_pet())
+
+    assert sorted(event_service.ensure_calls) == ["event-1", "event-2"]
+    assert payload.active_events == ["event-1", "event-2"]
+    assert updated_stats.energy == 70
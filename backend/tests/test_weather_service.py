@@ -0,0 +1,75 @@
+"""
+Unit tests for the weather service
+"""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.services.weather_service import WeatherService
+
+
+def _weather_payload() -> dict:
+    return {
+        "weather": [{"main": "Rain", "description": "light rain", "icon": "10d"}],
+        "main": {"temp": 12.5, "humidity": 80},
+        "wind": {"speed": 5.0},
+    }
+
+
+def _service(handler) -> WeatherService:
+    with patch("app.services.weather_service.get_settings") as mock_settings:
+        mock_settings.return_value.weather_api_key = "test-key"
+        return WeatherService(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+@pytest.mark.asyncio
+async def test_injected_client_is_reused_across_fetches():
+    """The HTTP client stays open between requests"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params["lat"])
+        return httpx.Response(200, json=_weather_payload())
+
+    service = _service(handler)
+
+    first = await service.get_weather(user_id="u1", lat=10.0, lon=20.0)
+    second = await service.get_weather(user_id="u1", lat=-30.0, lon=40.0)
+
+    assert first.condition == "Rain" and not first.is_fallback
+    assert second.condition == "Rain" and not second.is_fallback
+    assert len(calls) == 2
+
+    await service.aclose()
+    assert not service._client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_network_error_uses_fallback_snapshot():
+    """Provider failures degrade to the fallback snapshot"""
+    service = _service(lambda request: httpx.Response(503))
+
+    snapshot = await service.get_weather(user_id="u1", lat=10.0, lon=20.0)
+
+    assert snapshot.is_fallback
+    assert snapshot.provider == "fallback"
+
+
+@pytest.mark.asyncio
+async def test_nearby_coordinates_share_cache_across_users():
+    """Requests within the rounding precision reuse one fetch"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        return httpx.Response(200, json=_weather_payload())
+
+    service = _service(handler)
+
+    await service.get_weather(user_id="u1", lat=40.71281, lon=-74.00601)
+    await service.get_weather(user_id="u2", lat=40.71279, lon=-74.00599)
+
+    assert len(calls) == 1
@@ -0,0 +1,17 @@
+-- 030_public_profiles_search_trgm_indexes.sql
+-- Description: Adds trigram indexes so the public profile search
+--   (display_name / bio ILIKE '%term%') can use an index instead of
+--   scanning every visible profile.
+
+BEGIN;
+
+CREATE SCHEMA IF NOT EXISTS extensions;
+CREATE EXTENSION IF NOT EXISTS pg_trgm SCHEMA extensions;
+
+CREATE INDEX IF NOT EXISTS idx_public_profiles_display_name_trgm
+ON public.public_profiles USING gin (display_name extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_public_profiles_bio_trgm
+ON public.public_profiles USING gin (bio extensions.gin_trgm_ops);
+
+COMMIT;
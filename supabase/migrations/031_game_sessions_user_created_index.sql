@@ -0,0 +1,16 @@
+-- 031_game_sessions_user_created_index.sql
+-- Description: Adds a composite (user_id, created_at) index on game_sessions
+--   so per-user session history ordered or bucketed by time is served by
+--   an index range scan instead of fetching and sorting every user row.
+--   The composite index also covers plain user_id lookups, so the
+--   single-column idx_game_sessions_user_id from 007_games.sql is dropped
+--   to avoid maintaining both on every session insert.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_game_sessions_user_created
+ON public.game_sessions(user_id, created_at DESC);
+
+DROP INDEX IF EXISTS public.idx_game_sessions_user_id;
+
+COMMIT;